@@ -42,6 +42,18 @@ FILE_TARGET = "CardName (Artist).jpg"
 # Python command - auto-detect
 PYTHON_COMMAND = shutil.which("python3") or shutil.which("python") or "python3"
 
+# GIMP command used to launch headless render workers - auto-detect
+GIMP_COMMAND = (
+    shutil.which("gimp-console-3.0")
+    or shutil.which("gimp-console")
+    or shutil.which("gimp")
+    or "gimp"
+)
+
+# Number of GIMP processes render_all.run_parallel() starts.
+# Set to None to use one per CPU core.
+RENDER_WORKERS = None
+
 
 # Output file settings
 # Format: 'jpeg' or 'png'
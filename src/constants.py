@@ -6,6 +6,8 @@ Contains layer names, symbol mappings, ability words, card classes,
 font names, spacing values, and symbol color definitions.
 """
 
+import sys
+
 # File paths (relative to project root)
 JSON_FILE_PATH = "/scripts/card.json"
 IMAGE_FILE_PATH = "/scripts/card.jpg"
@@ -169,7 +171,15 @@ class LayerNames:
     # LAND already defined above
 
 
-DEFAULT_LAYER = "Layer 1"
+# Layer names stay plain strings because they are compared directly against
+# GIMP layer names, but interning them lets dict lookups and equality checks
+# against other interned names short-circuit on identity.
+for _attr, _value in list(vars(LayerNames).items()):
+    if not _attr.startswith("_") and isinstance(_value, str):
+        setattr(LayerNames, _attr, sys.intern(_value))
+del _attr, _value
+
+DEFAULT_LAYER = sys.intern("Layer 1")
 
 # ---------------------------------------------------------------------------
 # Basic land names
@@ -46,10 +46,13 @@ def rgb_to_hex(rgb):
     return "#{:02x}{:02x}{:02x}".format(rgb[0], rgb[1], rgb[2])
 
 
+_PANGO_ESCAPES = str.maketrans({
+    '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&apos;',
+})
+
+
 def escape_pango(text):
-    return (text.replace('&', '&amp;').replace('<', '&lt;')
-            .replace('>', '&gt;').replace('"', '&quot;')
-            .replace("'", '&apos;'))
+    return text.translate(_PANGO_ESCAPES)
 
 
 def locate_symbols(input_string):
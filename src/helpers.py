@@ -1,9 +1,11 @@
 import gi
 gi.require_version('Gimp', '3.0')
 import gi.repository as gir
-import subprocess
 import os
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from urllib import request as url_request
 from src.constants import RGB_BLACK, RGB_WHITE
 
 Gimp = getattr(gir, "Gimp")
@@ -96,15 +98,16 @@ def get_pango_family(gimp_font_name):
     # Strategy: find the longest fontconfig family name that the GIMP font
     # name starts with. E.g. 'Plantin MT Pro Regular' starts with
     # 'Plantin MT Pro' (len 14) which is longer than 'Plantin' (len 7).
-    best_match = None
-    best_len = 0
-    for fam_name in families:
-        if gimp_font_name == fam_name or gimp_font_name.startswith(fam_name + ' '):
-            if len(fam_name) > best_len:
-                best_match = fam_name
-                best_len = len(fam_name)
-
-    result = best_match if best_match is not None else gimp_font_name
+    # Only the full name and its prefixes ending at a word boundary can
+    # match, so test those against the family set, longest first, instead
+    # of scanning every installed family.
+    result = gimp_font_name
+    candidate = gimp_font_name
+    while candidate:
+        if candidate in families:
+            result = candidate
+            break
+        candidate = candidate[:max(candidate.rfind(' '), 0)]
     _pango_family_cache[gimp_font_name] = result
     return result
 
@@ -265,6 +268,33 @@ def rgb_white():
     return Gegl.Color.new("rgb(255,255,255)")
 
 
+# Shared colour instances for callers that only read them, so one of each is
+# enough. They are created on first use rather than at import so modules can be
+# imported before GEGL is initialised.
+_SHARED_BLACK = None
+_SHARED_WHITE = None
+
+
+def shared_black():
+    """
+    Returns a shared SolidColour for solid black. Do not modify it; use rgb_black() for a new one.
+    """
+    global _SHARED_BLACK
+    if _SHARED_BLACK is None:
+        _SHARED_BLACK = rgb_black()
+    return _SHARED_BLACK
+
+
+def shared_white():
+    """
+    Returns a shared SolidColour for solid white. Do not modify it; use rgb_white() for a new one.
+    """
+    global _SHARED_WHITE
+    if _SHARED_WHITE is None:
+        _SHARED_WHITE = rgb_white()
+    return _SHARED_WHITE
+
+
 def compute_layer_dimensions(layer):
     """
     Return an object with the specified layer's width and height (computed from its bounds).
@@ -275,6 +305,19 @@ def compute_layer_dimensions(layer):
     }
 
 
+_pdb_procedure_cache = {}
+
+
+def _pdb_procedure(name):
+    """Look up a PDB procedure once per process; text fitting measures ink
+    bounds on every font-size step, so the lookups add up."""
+    proc = _pdb_procedure_cache.get(name)
+    if proc is None:
+        proc = Gimp.get_pdb().lookup_procedure(name)
+        _pdb_procedure_cache[name] = proc
+    return proc
+
+
 def _get_ink_bounds(image, layer):
     """
     Return the ink bounding box (left, top, right, bottom) of a text layer.
@@ -290,9 +333,8 @@ def _get_ink_bounds(image, layer):
     layer_copy.set_visible(True)
     ink_bounds = None
     try:
-        pdb = Gimp.get_pdb()
         # Alpha-to-selection on the copy using correct GIMP 3 PDB pattern
-        sel_proc = pdb.lookup_procedure('gimp-image-select-item')
+        sel_proc = _pdb_procedure('gimp-image-select-item')
         sel_cfg = sel_proc.create_config()
         sel_cfg.set_property('image', image)
         sel_cfg.set_property('operation', 2)  # CHANNEL_OP_REPLACE
@@ -300,7 +342,7 @@ def _get_ink_bounds(image, layer):
         sel_proc.run(sel_cfg)
 
         # Read selection bounds via PDB
-        sb_proc = pdb.lookup_procedure('gimp-selection-bounds')
+        sb_proc = _pdb_procedure('gimp-selection-bounds')
         sb_cfg = sb_proc.create_config()
         sb_cfg.set_property('image', image)
         sb_result = sb_proc.run(sb_cfg)
@@ -312,7 +354,7 @@ def _get_ink_bounds(image, layer):
 
         if non_empty and (x2 - x1) > 0 and (y2 - y1) > 0:
             ink_bounds = (x1, y1, x2, y2)
-        sel_none = pdb.lookup_procedure('gimp-selection-none')
+        sel_none = _pdb_procedure('gimp-selection-none')
         snc = sel_none.create_config()
         snc.set_property('image', image)
         sel_none.run(snc)
@@ -515,6 +557,29 @@ def find_layer_by_name(image_or_group, name, recursive=False):
     return None
 
 
+def index_layers_by_name(image_or_group):
+    """Map the names of the direct children of image_or_group to the children.
+
+    Each child is indexed under its own name and under its name with GIMP's
+    '#N' suffix stripped, keeping the first child for each key, so a lookup in
+    the index returns the same layer as find_layer_by_name() (non-recursive).
+    Keys are interned, like the LayerNames constants they are looked up with.
+    """
+    if hasattr(image_or_group, 'get_layers'):
+        layers = image_or_group.get_layers()
+    elif hasattr(image_or_group, 'get_children'):
+        layers = image_or_group.get_children()
+    else:
+        return {}
+
+    index = {}
+    for layer in layers:
+        layer_name = sys.intern(layer.get_name())
+        index.setdefault(layer_name, layer)
+        index.setdefault(sys.intern(_strip_gimp_suffix(layer_name)), layer)
+    return index
+
+
 def select_layer_pixels(image, layer):
     """
     Select the bounding box of a given layer.
@@ -1006,15 +1071,72 @@ def paste_file_into_new_layer(image, file):
     return paste_file(image, new_layer, file)
 
 
+# Scryfall scans being downloaded ahead of time, keyed by image URL. Each value
+# is a future resolving to the image bytes; entries are removed when consumed.
+_SCAN_CACHE = {}
+_scan_executor = None
+_SCAN_HEADERS = {"User-Agent": "MTG-GIMP-Automation/1.0"}
+
+
+def _download_scryfall_scan(image_url):
+    """Download a Scryfall scan and return the image bytes."""
+    req = url_request.Request(image_url, headers=_SCAN_HEADERS)
+    with url_request.urlopen(req) as response:
+        return response.read()
+
+
+def prefetch_scryfall_scan(image_url):
+    """
+    Start downloading a Scryfall scan on a background thread so it is ready by the time
+    retrieve_scryfall_scan() asks for it. Does nothing if the scan is already queued.
+    """
+    global _scan_executor
+    if not image_url or image_url in _SCAN_CACHE:
+        return
+    if _scan_executor is None:
+        _scan_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="scryfall-scan")
+    _SCAN_CACHE[image_url] = _scan_executor.submit(_download_scryfall_scan, image_url)
+
+
+def discard_scryfall_scan(image_url):
+    """
+    Drop a prefetched scan that will not be used, cancelling the download if it has not started.
+    """
+    prefetched = _SCAN_CACHE.pop(image_url, None)
+    if prefetched is not None:
+        prefetched.cancel()
+
+
+def clear_scan_cache():
+    """
+    Drop every prefetched scan, cancelling downloads that have not started.
+    """
+    for prefetched in _SCAN_CACHE.values():
+        prefetched.cancel()
+    _SCAN_CACHE.clear()
+
+
 def retrieve_scryfall_scan(image_url, file_path):
     """
-    Calls the Python script which queries Scryfall for full-res scan and saves the resulting jpeg to disk in /scripts.
-    Returns a file path for the scan if the Python call was successful, or raises an error if it wasn't.
+    Downloads the full-res Scryfall scan and saves the resulting jpeg to disk in /scripts.
+    Returns a file path for the scan, or raises an error if the download failed.
+    Uses the prefetched download from prefetch_scryfall_scan() when there is one.
     """
-    script_path = os.path.join(file_path, "scripts", "get_card_scan.py")
-    python_command = os.environ.get("PYTHON", "python3")
-    subprocess.run([python_command, script_path, image_url], check=True)
-    return os.path.join(file_path, "scripts", "card.jpg")
+    scan_path = os.path.join(file_path, "scripts", "card.jpg")
+    data = None
+    prefetched = _SCAN_CACHE.pop(image_url, None)
+    if prefetched is not None:
+        try:
+            data = prefetched.result()
+        except Exception as err:
+            print(f"Prefetching Scryfall scan failed ({err}), retrying")
+    if data is None:
+        data = _download_scryfall_scan(image_url)
+
+    os.makedirs(os.path.dirname(scan_path), exist_ok=True)
+    with open(scan_path, "wb") as scan_file:
+        scan_file.write(data)
+    return scan_path
 
 
 def insert_scryfall_scan(image, image_url, file_path):
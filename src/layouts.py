@@ -1,4 +1,5 @@
 import re
+from functools import cached_property
 from types import SimpleNamespace
 
 from src.constants import (
@@ -58,6 +59,11 @@ class BaseLayout:
         self.is_nyx = "nyxtouched" in self.frame_effects
         self.is_colourless = ret["is_colourless"]
 
+    @cached_property
+    def pt_string(self):
+        """Power/toughness as printed in the P/T box, e.g. "2/3"."""
+        return f"{self.power}/{self.toughness}"
+
     def unpack_scryfall(self):
         self.rarity = self.scryfall["rarity"]
         self.artist = self.scryfall["artist"]
@@ -67,10 +73,10 @@ class BaseLayout:
         self.keywords = []
         if "keywords" in self.scryfall:
             self.keywords = self.scryfall["keywords"]
-        self.frame_effects = []
-        if "frame_effects" in self.scryfall:
-            self.frame_effects = self.scryfall["frame_effects"]
+        # Only ever used for membership tests, so store it as a set.
+        self.frame_effects = frozenset(self.scryfall.get("frame_effects", ()))
         self.set_code = self.scryfall.get("set", "")
+        self.loyalty = self.scryfall.get("loyalty", "")
 
     def get_default_class(self):
         default_class = self.scryfall.get("layout")
@@ -136,6 +142,7 @@ class TransformLayout(BaseLayout):
         self.toughness = self.scryfall["card_faces"][self.face].get("toughness") or None
         self.other_face_toughness = self.scryfall["card_faces"][self.other_face].get("toughness") or None
         self.colour_indicator = self.scryfall["card_faces"][self.face].get("color_indicator")
+        self.loyalty = self.scryfall["card_faces"][self.face].get("loyalty", "")
         # TODO: safe to assume the first frame effect will be the transform icon?
         self.transform_icon = self.scryfall["frame_effects"][0]
 
@@ -191,6 +198,7 @@ class ModalDoubleFacedLayout(BaseLayout):
         self.power = self.scryfall["card_faces"][self.face].get("power") or None
         self.toughness = self.scryfall["card_faces"][self.face].get("toughness") or None
         self.colour_indicator = self.scryfall["card_faces"][self.face].get("color_indicator")
+        self.loyalty = self.scryfall["card_faces"][self.face].get("loyalty", "")
         self.transform_icon = "modal_dfc"
 
         self.other_face_twins = select_frame_layers(
@@ -30,8 +30,9 @@ from .constants import (
     TRANSFORM_BACK_CLASS,
     TRANSFORM_FRONT_CLASS,
 )
-from .helpers import in_array, save_and_close
+from .helpers import in_array, discard_scryfall_scan, prefetch_scryfall_scan, save_and_close
 from .layouts import layout_map
+from .text_layers import clear_reference_bounds
 
 _SCRYFALL_HEADERS = {
     "User-Agent": "MTG-GIMP-Automation/1.0",
@@ -167,8 +168,8 @@ def call_python(card_name, file_path):
     return card_json
 
 
-def select_template(layout, file_path_str, file_path):
-    """Instantiate a template object based on card layout and configuration."""
+def select_template_class(layout):
+    """Return the template class to use for a card layout and configuration."""
     class_template_map = _get_template_map()
     template_entry = class_template_map[layout.card_class]
 
@@ -178,15 +179,27 @@ def select_template(layout, file_path_str, file_path):
 
     if not callable(template_ctor):
         raise RuntimeError(f"Template for card class '{layout.card_class}' is not callable")
-    return template_ctor(layout, file_path_str, file_path)
+    return template_ctor
 
 
-def render(file_path_str, project_path):
-    """Render a single card.
+def select_template(layout, file_path_str, file_path):
+    """Instantiate a template object based on card layout and configuration."""
+    return select_template_class(layout)(layout, file_path_str, file_path)
 
-    Args:
-        file_path_str: Path to the art file (e.g., "CardName (Artist).jpg")
-        project_path: Path to the project root directory
+
+def prefetch_card_scan(layout, template_class=None):
+    """Start downloading the card's Scryfall scan if its template pastes one."""
+    if template_class is None:
+        template_class = select_template_class(layout)
+    if getattr(template_class, "USES_SCRYFALL_SCAN", False):
+        prefetch_scryfall_scan(layout.scryfall_scan)
+
+
+def load_layout(file_path_str, project_path):
+    """Build the layout for an art file: parse its name and fetch its card data.
+
+    Makes no GIMP calls, so batch renders can run it ahead of time on a
+    worker thread.
     """
     ret = retrieve_card_name_and_artist(file_path_str)
     card_name = ret["card_name"]
@@ -209,12 +222,40 @@ def render(file_path_str, project_path):
 
         if artist != "":
             layout.artist = artist
+    return layout
 
-    template: Any = select_template(layout, file_path_str, project_path)
-    # expansion_symbol_character is now set in BaseTemplate.__init__ via config import
-    template.exit_early = EXIT_EARLY
 
-    file_name = template.execute()
+def render(file_path_str, project_path, layout=None):
+    """Render a single card.
+
+    Args:
+        file_path_str: Path to the art file (e.g., "CardName (Artist).jpg")
+        project_path: Path to the project root directory
+        layout: The card's layout, if already built with load_layout()
+    """
+    # Without art there is nothing to render, so don't load or build a template.
+    art_path = file_path_str.get_path() if hasattr(file_path_str, "get_path") else str(file_path_str)
+    if not os.path.isfile(art_path):
+        print(f"Art file not found, skipping: {art_path}")
+        return
+
+    if layout is None:
+        layout = load_layout(file_path_str, project_path)
+
+    template_class = select_template_class(layout)
+    # Download the scan while the template file is loading, unless a batch
+    # render already queued it.
+    prefetch_card_scan(layout, template_class)
+    try:
+        template: Any = template_class(layout, file_path_str, project_path)
+        # expansion_symbol_character is now set in BaseTemplate.__init__ via config import
+        template.exit_early = EXIT_EARLY
+        file_name = template.execute()
+    finally:
+        clear_reference_bounds()
+        # retrieve_scryfall_scan() pops the scan it uses; drop it here too in
+        # case the template skipped or failed before getting that far.
+        discard_scryfall_scan(getattr(layout, "scryfall_scan", None))
     if EXIT_EARLY:
         raise RuntimeError("Exiting...")
     save_and_close(template.image, file_name, project_path)
@@ -1,35 +1,199 @@
 """Batch render all cards from the art/ folder."""
 
+import argparse
 import glob
 import importlib
 import os
+import queue
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
+ART_PATTERNS = ["*.jpg", "*.jpeg", "*.png", "*.tif"]
+# How many upcoming cards run() starts downloading Scryfall scans for.
+SCAN_PREFETCH_AHEAD = 2
+# Prefix of the line a run_parallel() worker prints after each card, so the
+# parent can count finished cards among GIMP's own output.
+CARD_DONE_MARKER = "RENDER_ALL_CARD_DONE "
 
-def run(project_path=None):
-    """Render all card art files in the art/ directory."""
-    if project_path is None:
-        project_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
-    if __package__:
-        from .render import render
-    else:
-        render = importlib.import_module("src.render").render
+def _default_project_path():
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 
+def find_art_files(project_path):
+    """Return the sorted list of card art files in the project's art/ directory."""
     art_dir = os.path.join(project_path, "art")
-    patterns = ["*.jpg", "*.jpeg", "*.png", "*.tif"]
     files = []
-    for pattern in patterns:
+    for pattern in ART_PATTERNS:
         files.extend(glob.glob(os.path.join(art_dir, pattern)))
+    return sorted(files)
+
+
+def run(project_path=None, files=None, report_progress=False):
+    """Render all card art files in the art/ directory.
+
+    Args:
+        project_path: Path to the project root directory.
+        files: Optional explicit list of art files to render instead of
+            scanning art/ (used by run_parallel() workers).
+        report_progress: Print a CARD_DONE_MARKER line after each card
+            (used by run_parallel() workers).
+    """
+    if project_path is None:
+        project_path = _default_project_path()
+
+    if __package__:
+        from .render import load_layout, prefetch_card_scan, render
+        from .helpers import clear_scan_cache
+        from .templates import clear_template_cache
+        from .text_layers import clear_text_measurement_cache
+    else:
+        render_module = importlib.import_module("src.render")
+        load_layout, render = render_module.load_layout, render_module.render
+        prefetch_card_scan = render_module.prefetch_card_scan
+        clear_scan_cache = importlib.import_module("src.helpers").clear_scan_cache
+        clear_template_cache = importlib.import_module("src.templates").clear_template_cache
+        clear_text_measurement_cache = importlib.import_module("src.text_layers").clear_text_measurement_cache
+
+    if files is None:
+        files = find_art_files(project_path)
+
+    # Card data is fetched from Scryfall on one background thread, in order,
+    # while GIMP renders on this one; GIMP calls never leave this thread.
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        layouts = [executor.submit(load_layout, file_path, project_path) for file_path in files]
+        for index, (file_path, layout) in enumerate(zip(files, layouts)):
+            # Queue the scans of the next few cards whose data has arrived, so
+            # they download while this card renders.
+            for upcoming in layouts[index + 1:index + 1 + SCAN_PREFETCH_AHEAD]:
+                if upcoming.done() and upcoming.exception() is None:
+                    try:
+                        prefetch_card_scan(upcoming.result())
+                    except Exception:
+                        pass  # render() reports the problem when it gets to that card
+            try:
+                render(file_path, project_path, layout.result())
+                if report_progress:
+                    print(CARD_DONE_MARKER + file_path, flush=True)
+            except Exception as error:
+                if "Exiting" in str(error):
+                    break
+                print(f"Error rendering {file_path}: {error}")
+                raise
+    finally:
+        executor.shutdown(cancel_futures=True)
+        clear_template_cache()
+        clear_text_measurement_cache()
+        clear_scan_cache()
+
+
+def _gimp_batch_command(gimp_command, project_path, files):
+    """Build the command line for a headless GIMP process rendering files."""
+    script = (
+        "import sys\n"
+        f"sys.path.insert(0, {project_path!r})\n"
+        "from src.render_all import run\n"
+        f"run(project_path={project_path!r}, files={list(files)!r}, report_progress=True)\n"
+    )
+    return [gimp_command, "-idf", "--batch-interpreter=python-fu-eval", "-b", script, "--quit"]
+
 
-    for file_path in sorted(files):
-        try:
-            render(file_path, project_path)
-        except Exception as error:
-            if "Exiting" in str(error):
-                break
-            print(f"Error rendering {file_path}: {error}")
-            raise
+def run_parallel(project_path=None, workers=None):
+    """Render the art/ directory with several headless GIMP processes.
+
+    Call this from a plain Python interpreter, not from inside GIMP. The art
+    files are dealt round-robin into one shard per worker and each shard is
+    rendered by its own GIMP process via run(), so every worker loads its
+    templates once into its own template cache and no image is ever shared
+    between processes.
+    """
+    if project_path is None:
+        project_path = _default_project_path()
+
+    if __package__:
+        from .config import GIMP_COMMAND, RENDER_WORKERS
+    else:
+        config = importlib.import_module("src.config")
+        GIMP_COMMAND, RENDER_WORKERS = config.GIMP_COMMAND, config.RENDER_WORKERS
+
+    files = find_art_files(project_path)
+    if not files:
+        return
+
+    if workers is None:
+        workers = RENDER_WORKERS or os.cpu_count() or 1
+    workers = max(1, min(workers, len(files)))
+    shards = [files[i::workers] for i in range(workers)]
+
+    processes = [
+        subprocess.Popen(
+            _gimp_batch_command(GIMP_COMMAND, project_path, shard),
+            stdout=subprocess.PIPE, text=True, bufsize=1,
+        )
+        for shard in shards
+    ]
+    print(f"Rendering {len(files)} cards with {len(processes)} GIMP workers")
+
+    # One thread per worker forwards its stdout lines to this thread; None
+    # marks the end of a worker's output. Cards are counted as their marker
+    # lines arrive, and everything else the worker prints is passed through.
+    lines = queue.Queue()
+
+    def read_output(index, stream):
+        for line in stream:
+            lines.put((index, line))
+        lines.put((index, None))
+
+    readers = [
+        threading.Thread(target=read_output, args=(index, process.stdout), daemon=True)
+        for index, process in enumerate(processes)
+    ]
+    for reader in readers:
+        reader.start()
+
+    running = len(processes)
+    failed = 0
+    done = 0
+    while running:
+        index, line = lines.get()
+        if line is None:
+            running -= 1
+            returncode = processes[index].wait()
+            status = "done" if returncode == 0 else f"failed (exit {returncode})"
+            print(f"Worker {index + 1}/{len(processes)} {status}: {done}/{len(files)} cards")
+            if returncode != 0:
+                failed += 1
+        elif line.startswith(CARD_DONE_MARKER):
+            done += 1
+            card = os.path.basename(line[len(CARD_DONE_MARKER):].rstrip("\n"))
+            print(f"[{done}/{len(files)}] {card}")
+        else:
+            sys.stdout.write(line)
+    if failed:
+        raise RuntimeError(f"{failed} of {len(processes)} render workers failed")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render every card in the art/ folder.")
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="render with this many headless GIMP processes (run from plain "
+             "Python, outside GIMP); 0 uses RENDER_WORKERS or the CPU count",
+    )
+    parser.add_argument(
+        "--serial", action="store_true",
+        help="render every card in this process (the default; run inside GIMP)",
+    )
+    # GIMP's batch interpreter can leave its own arguments in sys.argv.
+    args, _ = parser.parse_known_args(argv)
+    if args.serial or args.workers is None:
+        run()
+    else:
+        run_parallel(workers=args.workers or None)
 
 
 if __name__ == "__main__":
-    run()
+    main()
@@ -7,6 +7,7 @@ populate text fields.
 """
 
 import os
+import re
 
 import gi
 gi.require_version('Gimp', '3.0')
@@ -15,11 +16,11 @@ import gi.repository as gir
 from src.constants import LayerNames, DEFAULT_LAYER, FONT_NAME_BELEREN, FONT_NAME_KEYRUNE
 from src.config import EXPANSION_SYMBOL_CHARACTER, get_expansion_symbol_character
 from src.helpers import (
-    find_layer_by_name, paste_file, frame_layer, save_and_close,
-    rgb_black, rgb_white, get_text_layer_colour, strip_reminder_text,
+    find_layer_by_name, index_layers_by_name, paste_file, frame_layer, save_and_close,
+    shared_black, shared_white, get_text_layer_colour, strip_reminder_text,
     replace_text, enable_active_layer_mask, disable_active_layer_mask,
     enable_active_vector_mask, disable_active_vector_mask,
-    insert_scryfall_scan, in_array, ensure_text_layer,
+    insert_scryfall_scan, ensure_text_layer,
 )
 from src.text_layers import (
     TextField, ScaledTextField, ExpansionSymbolField,
@@ -45,7 +46,47 @@ _ = (
 )
 
 
+# Planeswalker loyalty ability, e.g. "+1: Draw a card." -> ("+1", "Draw a card.").
+# The cost is the shortest 1-4 character prefix before ": ", matching the
+# first ": " in the text; an ability that starts with ": " is static.
+_LOYALTY_RE = re.compile(r'^(?!: )(.{1,4}?): (.*)$', re.DOTALL)
+
+
+# Template images loaded from disk, keyed by .xcf path. Loading an XCF is the
+# most expensive step of a render, so it happens once per template per session
+# and each card works on a duplicate of the cached image.
+_TEMPLATE_CACHE = {}
+
+
+def clear_template_cache():
+    """Delete every cached template image and empty the cache."""
+    for image in _TEMPLATE_CACHE.values():
+        try:
+            image.delete()
+        except Exception:
+            pass
+    _TEMPLATE_CACHE.clear()
+
+
 class BaseTemplate:
+    # One template is built per card and only ever carries the attributes
+    # below, so slots keep instances small and attribute access cheap.
+    __slots__ = (
+        "layout", "file", "file_path", "image", "exit_early",
+        "expansion_symbol_character", "art_reference", "art_layer", "legal", "text_layers",
+        "_layer_cache", "_child_index", "_text_and_icons", "_pending_visibility",
+        "_colour_cache",
+    )
+
+    # Whether the template pastes the card's Scryfall scan, so the render
+    # pipeline knows to start downloading it early.
+    USES_SCRYFALL_SCAN = False
+    # Base name of the .xcf under templates/; set by every concrete template.
+    TEMPLATE_FILE_NAME = None
+    # (group name, layout attribute) pairs for _enable_frame_path(): in each
+    # group, the child named by that layout attribute is made visible.
+    FRAME_PATH = ()
+
     def __init__(self, layout, file, file_path):
         self.layout = layout
         self.file = file
@@ -53,6 +94,17 @@ class BaseTemplate:
         self.exit_early = False
         self.expansion_symbol_character = get_expansion_symbol_character(getattr(self.layout, 'set_code', ''))
         self.art_reference = None
+        # _layer() memo: (id(parent), name) -> layer (or None when missing),
+        # plus a per-parent {name: child} index built the first time a
+        # parent is searched. The index entry also holds the parent itself so
+        # its id() cannot be recycled while the cache is alive.
+        self._layer_cache = {}
+        self._child_index = {}
+        self._text_and_icons = None
+        # layer -> visibility, applied in one undo group by _flush_visibility()
+        self._pending_visibility = {}
+        # id(layer) -> (layer, colour) for _colour()
+        self._colour_cache = {}
 
         self.load_template(file_path)
 
@@ -63,48 +115,135 @@ class BaseTemplate:
                 image=self.image,
                 layer=self._layer(self.legal, LayerNames.ARTIST),
                 text_contents=self.layout.artist,
-                text_colour=rgb_white(),
+                text_colour=shared_white(),
                 font_size=FONT_SIZE_ARTIST,
             ),
         ]
 
+    @property
+    def text_and_icons(self):
+        """The top-level "Text and Icons" group, resolved on first use."""
+        if self._text_and_icons is None:
+            self._text_and_icons = self._layer(self.image, LayerNames.TEXT_AND_ICONS)
+        return self._text_and_icons
+
+    def _colour(self, layer):
+        """get_text_layer_colour(), read once per layer for the life of the template."""
+        entry = self._colour_cache.get(id(layer))
+        if entry is None:
+            entry = (layer, get_text_layer_colour(layer))
+            self._colour_cache[id(layer)] = entry
+        return entry[1]
+
+    def _add_text(self, cls, layer, text_contents, **kwargs):
+        """Append a cls text field for layer, defaulting to the layer's own colour."""
+        if "text_colour" not in kwargs:
+            kwargs["text_colour"] = self._colour(layer)
+        self.text_layers.append(cls(image=self.image, layer=layer, text_contents=text_contents, **kwargs))
+
     def _layer(self, image_or_group, name):
-        layer = find_layer_by_name(image_or_group, name)
-        if layer is None:
-            layer = find_layer_by_name(image_or_group, name, recursive=True)
+        layer = self._layer_optional(image_or_group, name)
         if layer is None:
             raise RuntimeError(f"Layer not found: {name}")
         return layer
 
+    def _layer_optional(self, image_or_group, name):
+        """Like _layer(), but returns None when the template has no such layer."""
+        key = (id(image_or_group), name)
+        if key in self._layer_cache:
+            return self._layer_cache[key]
+        layer = self._child_layers(image_or_group).get(name)
+        if layer is None:
+            layer = find_layer_by_name(image_or_group, name, recursive=True)
+        self._layer_cache[key] = layer
+        return layer
+
+    def _child_layers(self, image_or_group):
+        entry = self._child_index.get(id(image_or_group))
+        if entry is None:
+            entry = (image_or_group, index_layers_by_name(image_or_group))
+            self._child_index[id(image_or_group)] = entry
+        return entry[1]
+
+    def _set_visible(self, layer, visible):
+        """Queue a visibility change; _flush_visibility() applies the final state of each layer."""
+        self._pending_visibility[layer] = visible
+
+    def _is_visible(self, layer):
+        visible = self._pending_visibility.get(layer)
+        return layer.get_visible() if visible is None else visible
+
+    def _flush_visibility(self):
+        if not self._pending_visibility:
+            return
+        self.image.undo_group_start()
+        try:
+            for layer, visible in self._pending_visibility.items():
+                layer.set_visible(visible)
+        finally:
+            self.image.undo_group_end()
+        self._pending_visibility.clear()
+
+    def _replace_cached_layer(self, old_layer, new_layer):
+        """Point cached lookups at new_layer after old_layer was swapped out of the image."""
+        if old_layer in self._pending_visibility:
+            self._pending_visibility[new_layer] = self._pending_visibility.pop(old_layer)
+        for key, layer in self._layer_cache.items():
+            if layer is old_layer:
+                self._layer_cache[key] = new_layer
+        for _parent, index in self._child_index.values():
+            for name, layer in index.items():
+                if layer is old_layer:
+                    index[name] = new_layer
+
     def template_file_name(self) -> str:
-        raise NotImplementedError("Template name not specified!")
+        if self.TEMPLATE_FILE_NAME is None:
+            raise NotImplementedError("Template name not specified!")
+        return self.TEMPLATE_FILE_NAME
 
     def template_suffix(self) -> str:
         return ""
 
-    @staticmethod
-    def _hide_children(group):
+    def _hide_children(self, group):
+        # Most children of a frame group are already hidden in the template,
+        # so only pay for a visibility write on the ones that are showing.
         try:
             children = group.get_children() if hasattr(group, "get_children") else []
             for child in children:
-                child.set_visible(False)
+                if self._is_visible(child):
+                    self._set_visible(child, False)
         except Exception:
             pass
 
     def load_template(self, file_path):
         template_path = os.path.join(file_path, "templates", self.template_file_name() + ".xcf")
-        template_file = Gio.File.new_for_path(template_path)
-        try:
-            self.image = Gimp.file_load(Gimp.RunMode.NONINTERACTIVE, template_file)
-        except Exception as err:
-            raise RuntimeError(
-                f"\n\nFailed to open the template for this card at:\n\n"
-                f"{template_path}\n\nCheck your templates folder and try again"
-            ) from err
+        base_image = _TEMPLATE_CACHE.get(template_path)
+        if base_image is None:
+            template_file = Gio.File.new_for_path(template_path)
+            try:
+                base_image = Gimp.file_load(Gimp.RunMode.NONINTERACTIVE, template_file)
+            except Exception as err:
+                raise RuntimeError(
+                    f"\n\nFailed to open the template for this card at:\n\n"
+                    f"{template_path}\n\nCheck your templates folder and try again"
+                ) from err
+            self._hide_reference_layers(base_image)
+            _TEMPLATE_CACHE[template_path] = base_image
+        # Each card renders into its own copy; the cached image stays pristine.
+        self.image = base_image.duplicate()
 
     def enable_frame_layers(self):
         raise NotImplementedError("Frame layers not specified!")
 
+    def _frame_root(self):
+        return self.image
+
+    def _enable_frame_path(self):
+        root = self._frame_root()
+        for group_name, layout_attr in self.FRAME_PATH:
+            group = self._layer(root, group_name)
+            self._set_visible(self._layer(group, getattr(self.layout, layout_attr)), True)
+
     # Layer names that exist only as positioning references and should never
     # be visible in final output.  PSD->XCF conversion may leave them visible.
     _REFERENCE_LAYERS = (
@@ -115,28 +254,36 @@ class BaseTemplate:
         LayerNames.PT_TOP_REFERENCE,
     )
 
-    def _hide_reference_layers(self):
-        """Hide structural/reference layers that should not render visibly."""
-        for name in self._REFERENCE_LAYERS:
+    @classmethod
+    def _hide_reference_layers(cls, image):
+        """Hide structural/reference layers that should not render visibly.
+
+        Runs once per template file when it is first loaded into the cache, so
+        every duplicated card image inherits the hidden state.
+        """
+        for name in cls._REFERENCE_LAYERS:
             try:
-                layer = find_layer_by_name(self.image, name, recursive=True)
+                layer = find_layer_by_name(image, name, recursive=True)
                 if layer is not None:
                     layer.set_visible(False)
             except Exception:
                 pass
 
     def load_artwork(self):
-        self.art_layer = paste_file(self.image, self.art_layer, self.file)
+        art_layer = paste_file(self.image, self.art_layer, self.file)
+        self._replace_cached_layer(self.art_layer, art_layer)
+        self.art_layer = art_layer
 
     def execute(self):
+        self._flush_visibility()
         self.load_artwork()
         frame_layer(self.image, self.art_layer, self.art_reference)
         self.enable_frame_layers()
+        self._flush_visibility()
         # Fix Shadows blend mode — PSD→XCF conversion loses MULTIPLY mode
         shadows = find_layer_by_name(self.image, LayerNames.SHADOWS)
         if shadows is not None:
             shadows.set_mode(Gimp.LayerMode.MULTIPLY_LEGACY)
-        self._hide_reference_layers()
         for text_layer in self.text_layers:
             text_layer.execute()
         file_name = self.layout.name
@@ -147,47 +294,52 @@ class BaseTemplate:
 
 
 class ChilliBaseTemplate(BaseTemplate):
+    __slots__ = (
+        "is_creature", "is_legendary", "is_land", "is_companion",
+        "name_shifted", "type_line_shifted",
+    )
+
     def __init__(self, layout, file, file_path):
         super().__init__(layout, file, file_path)
 
         self.is_creature = self.layout.power is not None and self.layout.toughness is not None
-        self.is_legendary = "Legendary" in self.layout.type_line
-        self.is_land = "Land" in self.layout.type_line
-        self.is_companion = in_array(self.layout.frame_effects, "companion")
+        type_line_tokens = set(self.layout.type_line.split())
+        self.is_legendary = "Legendary" in type_line_tokens
+        self.is_land = "Land" in type_line_tokens
+        self.is_companion = "companion" in self.layout.frame_effects
         self.name_shifted = False
         self.type_line_shifted = False
 
     def basic_text_layers(self, text_and_icons):
         name = self._layer(text_and_icons, LayerNames.NAME)
         name_selected = name
-        try:
-            name_shift = self._layer(text_and_icons, LayerNames.NAME_SHIFT)
+        name_shift = self._layer_optional(text_and_icons, LayerNames.NAME_SHIFT)
+        if name_shift is not None:
             if self.name_shifted:
                 name_selected = name_shift
-                name.set_visible(False)
-                name_shift.set_visible(True)
+                self._set_visible(name, False)
+                self._set_visible(name_shift, True)
             else:
-                name_shift.set_visible(False)
-                name.set_visible(True)
-        except Exception:
-            pass
+                self._set_visible(name_shift, False)
+                self._set_visible(name, True)
 
         type_line = self._layer(text_and_icons, LayerNames.TYPE_LINE)
         type_line_selected = type_line
-        try:
-            type_line_shift = self._layer(text_and_icons, LayerNames.TYPE_LINE_SHIFT)
+        type_line_shift = self._layer_optional(text_and_icons, LayerNames.TYPE_LINE_SHIFT)
+        if type_line_shift is not None:
             if self.type_line_shifted:
                 type_line_selected = type_line_shift
-                type_line.set_visible(False)
-                type_line_shift.set_visible(True)
-
-                colour_indicator = self._layer(self.image, LayerNames.COLOUR_INDICATOR)
-                self._layer(colour_indicator, self.layout.pinlines).set_visible(True)
+                self._set_visible(type_line, False)
+                self._set_visible(type_line_shift, True)
+
+                colour_indicator = self._layer_optional(self.image, LayerNames.COLOUR_INDICATOR)
+                if colour_indicator is not None:
+                    indicator = self._layer_optional(colour_indicator, self.layout.pinlines)
+                    if indicator is not None:
+                        self._set_visible(indicator, True)
             else:
-                type_line_shift.set_visible(False)
-                type_line.set_visible(True)
-        except Exception:
-            pass
+                self._set_visible(type_line_shift, False)
+                self._set_visible(type_line, True)
 
         mana_cost = self._layer(text_and_icons, LayerNames.MANA_COST)
         expansion_symbol = self._layer(text_and_icons, LayerNames.EXPANSION_SYMBOL)
@@ -197,7 +349,7 @@ class ChilliBaseTemplate(BaseTemplate):
                 image=self.image,
                 layer=mana_cost,
                 text_contents=self.layout.mana_cost,
-                text_colour=rgb_black(),
+                text_colour=shared_black(),
                 font_size=FONT_SIZE_MANA_COST,
                 justification=Gimp.TextJustification.RIGHT,
             ),
@@ -205,7 +357,7 @@ class ChilliBaseTemplate(BaseTemplate):
                 image=self.image,
                 layer=name_selected,
                 text_contents=self.layout.name,
-                text_colour=get_text_layer_colour(name_selected),
+                text_colour=self._colour(name_selected),
                 reference_layer=mana_cost,
                 font_name=FONT_NAME_BELEREN,
                 font_size=FONT_SIZE_CARD_NAME,
@@ -221,18 +373,39 @@ class ChilliBaseTemplate(BaseTemplate):
                 image=self.image,
                 layer=type_line_selected,
                 text_contents=self.layout.type_line,
-                text_colour=get_text_layer_colour(type_line_selected),
+                text_colour=self._colour(type_line_selected),
                 reference_layer=expansion_symbol,
                 font_name=FONT_NAME_BELEREN,
                 font_size=FONT_SIZE_TYPE_LINE,
             ),
         ])
 
+    def _rules_text_is_centred(self):
+        """Short single-line rules text with no flavour text is centred in the textbox.
+
+        Decided from string lengths alone so no text has to be measured in GIMP.
+        """
+        oracle_text = self.layout.oracle_text
+        return (
+            len(self.layout.flavour_text) <= 1
+            and len(oracle_text) <= 70
+            and "\n" not in oracle_text
+        )
+
+    def _paint_black(self, layers, colour):
+        # These layers are plain Gimp.Layer (not TextLayer) due to PSD->XCF import.
+        # Convert them to TextLayer before calling set_color().
+        for layer in layers:
+            text_layer = ensure_text_layer(self.image, layer)
+            if text_layer is not layer:
+                self._replace_cached_layer(layer, text_layer)
+            text_layer.set_color(colour)
+
     def enable_hollow_crown(self, crown, pinlines):
         enable_active_layer_mask(crown)
         enable_active_layer_mask(pinlines)
         enable_active_layer_mask(self._layer(self.image, LayerNames.SHADOWS))
-        self._layer(self.image, LayerNames.HOLLOW_CROWN_SHADOW).set_visible(True)
+        self._set_visible(self._layer(self.image, LayerNames.HOLLOW_CROWN_SHADOW), True)
 
     def paste_scryfall_scan(self, reference_layer, file_path, rotate=False):
         layer = insert_scryfall_scan(self.image, self.layout.scryfall_scan, file_path)
@@ -242,15 +415,11 @@ class ChilliBaseTemplate(BaseTemplate):
 
 
 class NormalTemplate(ChilliBaseTemplate):
-    def template_file_name(self) -> str:
-        return "normal"
+    __slots__ = ()
+    TEMPLATE_FILE_NAME = "normal"
 
     def rules_text_and_pt_layers(self, text_and_icons):
-        is_centred = (
-            len(self.layout.flavour_text) <= 1
-            and len(self.layout.oracle_text) <= 70
-            and "\n" not in self.layout.oracle_text
-        )
+        is_centred = self._rules_text_is_centred()
 
         noncreature_copyright = self._layer(self.legal, LayerNames.NONCREATURE_COPYRIGHT)
         creature_copyright = self._layer(self.legal, LayerNames.CREATURE_COPYRIGHT)
@@ -262,8 +431,8 @@ class NormalTemplate(ChilliBaseTemplate):
                 TextField(
                     image=self.image,
                     layer=power_toughness,
-                    text_contents=f"{self.layout.power}/{self.layout.toughness}",
-                    text_colour=get_text_layer_colour(power_toughness),
+                    text_contents=self.layout.pt_string,
+                    text_colour=self._colour(power_toughness),
                     font_name=FONT_NAME_BELEREN,
                     font_size=FONT_SIZE_POWER_TOUGHNESS,
                 ),
@@ -271,7 +440,7 @@ class NormalTemplate(ChilliBaseTemplate):
                     image=self.image,
                     layer=rules_text,
                     text_contents=self.layout.oracle_text,
-                    text_colour=get_text_layer_colour(rules_text),
+                    text_colour=self._colour(rules_text),
                     flavour_text=self.layout.flavour_text,
                     is_centred=is_centred,
                     reference_layer=self._layer(text_and_icons, LayerNames.TEXTBOX_REFERENCE),
@@ -280,11 +449,11 @@ class NormalTemplate(ChilliBaseTemplate):
                 ),
             ])
 
-            noncreature_copyright.set_visible(False)
-            creature_copyright.set_visible(True)
+            self._set_visible(noncreature_copyright, False)
+            self._set_visible(creature_copyright, True)
             # Hide the unused noncreature rules text group
             noncreature_rules = self._layer(text_and_icons, LayerNames.RULES_TEXT_NONCREATURE)
-            noncreature_rules.set_visible(False)
+            self._set_visible(noncreature_rules, False)
         else:
             rules_text = self._layer(text_and_icons, LayerNames.RULES_TEXT_NONCREATURE)
             self.text_layers.append(
@@ -292,79 +461,104 @@ class NormalTemplate(ChilliBaseTemplate):
                     image=self.image,
                     layer=rules_text,
                     text_contents=self.layout.oracle_text,
-                    text_colour=get_text_layer_colour(rules_text),
+                    text_colour=self._colour(rules_text),
                     flavour_text=self.layout.flavour_text,
                     is_centred=is_centred,
                     reference_layer=self._layer(text_and_icons, LayerNames.TEXTBOX_REFERENCE),
                 ),
             )
 
-            power_toughness.set_visible(False)
+            self._set_visible(power_toughness, False)
 
             # Hide the unused creature rules text group
             creature_rules = self._layer(text_and_icons, LayerNames.RULES_TEXT_CREATURE)
-            creature_rules.set_visible(False)
+            self._set_visible(creature_rules, False)
     def __init__(self, layout, file, file_path):
         super().__init__(layout, file, file_path)
 
-        self.art_reference = self._layer(self.image, LayerNames.ART_FRAME)
+        art_frame_name = LayerNames.ART_FRAME
         if self.layout.is_colourless:
-            self.art_reference = self._layer(self.image, LayerNames.FULL_ART_FRAME)
+            art_frame_name = LayerNames.FULL_ART_FRAME
+        self.art_reference = self._layer(self.image, art_frame_name)
 
         self.name_shifted = self.layout.transform_icon is not None
         self.type_line_shifted = self.layout.colour_indicator is not None
 
-        text_and_icons = self._layer(self.image, LayerNames.TEXT_AND_ICONS)
+        text_and_icons = self.text_and_icons
         self.basic_text_layers(text_and_icons)
         self.rules_text_and_pt_layers(text_and_icons)
 
     def enable_frame_layers(self):
+        if not (self.is_creature or self.is_legendary or self.is_companion
+                or self.is_land or self.layout.is_nyx):
+            self._enable_common_frame_layers()
+            return
+
         twins = self._layer(self.image, LayerNames.TWINS)
         self._hide_children(twins)
-        self._layer(twins, self.layout.twins).set_visible(True)
+        self._set_visible(self._layer(twins, self.layout.twins), True)
         if self.is_creature:
             pt_box = self._layer(self.image, LayerNames.PT_BOX)
             self._hide_children(pt_box)
-            self._layer(pt_box, self.layout.twins).set_visible(True)
+            self._set_visible(self._layer(pt_box, self.layout.twins), True)
 
         pinlines = self._layer(self.image, LayerNames.PINLINES_TEXTBOX)
         if self.is_land:
             pinlines = self._layer(self.image, LayerNames.LAND_PINLINES_TEXTBOX)
         self._hide_children(pinlines)
-        self._layer(pinlines, self.layout.pinlines).set_visible(True)
+        self._set_visible(self._layer(pinlines, self.layout.pinlines), True)
 
         if self.is_land:
-            self._layer(self.image, LayerNames.PINLINES_TEXTBOX).set_visible(False)
+            self._set_visible(self._layer(self.image, LayerNames.PINLINES_TEXTBOX), False)
         else:
-            self._layer(self.image, LayerNames.LAND_PINLINES_TEXTBOX).set_visible(False)
+            self._set_visible(self._layer(self.image, LayerNames.LAND_PINLINES_TEXTBOX), False)
 
         background = self._layer(self.image, LayerNames.BACKGROUND)
         if self.layout.is_nyx:
             background = self._layer(self.image, LayerNames.NYX)
         self._hide_children(background)
-        self._layer(background, self.layout.background).set_visible(True)
+        self._set_visible(self._layer(background, self.layout.background), True)
 
         crown = None
         if self.is_legendary:
             crown = self._layer(self.image, LayerNames.LEGENDARY_CROWN)
             self._hide_children(crown)
-            self._layer(crown, self.layout.pinlines).set_visible(True)
+            self._set_visible(self._layer(crown, self.layout.pinlines), True)
             border = self._layer(self.image, LayerNames.BORDER)
             self._hide_children(border)
-            self._layer(border, LayerNames.NORMAL_BORDER).set_visible(False)
-            self._layer(border, LayerNames.LEGENDARY_BORDER).set_visible(True)
+            self._set_visible(self._layer(border, LayerNames.NORMAL_BORDER), False)
+            self._set_visible(self._layer(border, LayerNames.LEGENDARY_BORDER), True)
 
         if self.is_companion:
             companion = self._layer(self.image, LayerNames.COMPANION)
-            self._layer(companion, self.layout.pinlines).set_visible(True)
+            self._set_visible(self._layer(companion, self.layout.pinlines), True)
 
         if (self.is_legendary and self.layout.is_nyx) or self.is_companion:
             self.enable_hollow_crown(crown, pinlines)
 
+    def _enable_common_frame_layers(self):
+        """Frame setup for a non-creature, non-legendary, non-land, non-nyx card.
+
+        Equivalent to enable_frame_layers() for that case without evaluating
+        the branches that cannot apply.
+        """
+        twins = self._layer(self.image, LayerNames.TWINS)
+        self._hide_children(twins)
+        self._set_visible(self._layer(twins, self.layout.twins), True)
+
+        pinlines = self._layer(self.image, LayerNames.PINLINES_TEXTBOX)
+        self._hide_children(pinlines)
+        self._set_visible(self._layer(pinlines, self.layout.pinlines), True)
+        self._set_visible(self._layer(self.image, LayerNames.LAND_PINLINES_TEXTBOX), False)
+
+        background = self._layer(self.image, LayerNames.BACKGROUND)
+        self._hide_children(background)
+        self._set_visible(self._layer(background, self.layout.background), True)
+
 
 class NormalClassicTemplate(ChilliBaseTemplate):
-    def template_file_name(self) -> str:
-        return "normal-classic"
+    __slots__ = ()
+    TEMPLATE_FILE_NAME = "normal-classic"
 
     def template_suffix(self) -> str:
         return "Classic"
@@ -382,14 +576,10 @@ class NormalClassicTemplate(ChilliBaseTemplate):
         )
         self.text_layers = []
 
-        text_and_icons = self._layer(self.image, LayerNames.TEXT_AND_ICONS)
+        text_and_icons = self.text_and_icons
         self.basic_text_layers(text_and_icons)
 
-        is_centred = (
-            len(self.layout.flavour_text) <= 1
-            and len(self.layout.oracle_text) <= 70
-            and "\n" not in self.layout.oracle_text
-        )
+        is_centred = self._rules_text_is_centred()
         reference_layer = self._layer(text_and_icons, LayerNames.TEXTBOX_REFERENCE)
         if self.is_land:
             reference_layer = self._layer(text_and_icons, LayerNames.TEXTBOX_REFERENCE_LAND)
@@ -399,7 +589,7 @@ class NormalClassicTemplate(ChilliBaseTemplate):
                 image=self.image,
                 layer=rules_text,
                 text_contents=self.layout.oracle_text,
-                text_colour=get_text_layer_colour(rules_text),
+                text_colour=self._colour(rules_text),
                 flavour_text=self.layout.flavour_text,
                 is_centred=is_centred,
                 reference_layer=reference_layer,
@@ -412,14 +602,14 @@ class NormalClassicTemplate(ChilliBaseTemplate):
                 TextField(
                     image=self.image,
                     layer=power_toughness,
-                    text_contents=f"{self.layout.power}/{self.layout.toughness}",
-                    text_colour=get_text_layer_colour(power_toughness),
+                    text_contents=self.layout.pt_string,
+                    text_colour=self._colour(power_toughness),
                     font_name=FONT_NAME_BELEREN,
                     font_size=FONT_SIZE_POWER_TOUGHNESS,
                 ),
             )
         else:
-            power_toughness.set_visible(False)
+            self._set_visible(power_toughness, False)
 
     def enable_frame_layers(self):
         layers = self._layer(self.image, LayerNames.NONLAND)
@@ -428,12 +618,12 @@ class NormalClassicTemplate(ChilliBaseTemplate):
             layers = self._layer(self.image, LayerNames.LAND)
             selected_layer = self.layout.pinlines
 
-        self._layer(layers, selected_layer).set_visible(True)
+        self._set_visible(self._layer(layers, selected_layer), True)
 
 
 class NormalExtendedTemplate(NormalTemplate):
-    def template_file_name(self):
-        return "normal-extended"
+    __slots__ = ()
+    TEMPLATE_FILE_NAME = "normal-extended"
 
     def template_suffix(self):
         return "Extended"
@@ -444,8 +634,8 @@ class NormalExtendedTemplate(NormalTemplate):
 
 
 class WomensDayTemplate(NormalTemplate):
-    def template_file_name(self):
-        return "womensday"
+    __slots__ = ()
+    TEMPLATE_FILE_NAME = "womensday"
 
     def template_suffix(self):
         return "Showcase"
@@ -456,25 +646,25 @@ class WomensDayTemplate(NormalTemplate):
 
     def enable_frame_layers(self):
         twins = self._layer(self.image, LayerNames.TWINS)
-        self._layer(twins, self.layout.twins).set_visible(True)
+        self._set_visible(self._layer(twins, self.layout.twins), True)
         if self.is_creature:
             pt_box = self._layer(self.image, LayerNames.PT_BOX)
-            self._layer(pt_box, self.layout.twins).set_visible(True)
+            self._set_visible(self._layer(pt_box, self.layout.twins), True)
 
         pinlines = self._layer(self.image, LayerNames.PINLINES_TEXTBOX)
         if self.is_land:
             pinlines = self._layer(self.image, LayerNames.LAND_PINLINES_TEXTBOX)
-        self._layer(pinlines, self.layout.pinlines).set_visible(True)
+        self._set_visible(self._layer(pinlines, self.layout.pinlines), True)
 
         if self.is_legendary:
             crown = self._layer(self.image, LayerNames.LEGENDARY_CROWN)
-            self._layer(crown, self.layout.pinlines).set_visible(True)
+            self._set_visible(self._layer(crown, self.layout.pinlines), True)
             enable_active_layer_mask(pinlines)
 
 
 class StargazingTemplate(NormalTemplate):
-    def template_file_name(self):
-        return "stargazing"
+    __slots__ = ()
+    TEMPLATE_FILE_NAME = "stargazing"
 
     def template_suffix(self):
         return "Stargazing"
@@ -486,8 +676,8 @@ class StargazingTemplate(NormalTemplate):
 
 
 class MasterpieceTemplate(NormalTemplate):
-    def template_file_name(self):
-        return "masterpiece"
+    __slots__ = ()
+    TEMPLATE_FILE_NAME = "masterpiece"
 
     def template_suffix(self):
         return "Masterpiece"
@@ -508,8 +698,8 @@ class MasterpieceTemplate(NormalTemplate):
 
 
 class ExpeditionTemplate(NormalTemplate):
-    def template_file_name(self):
-        return "znrexp"
+    __slots__ = ()
+    TEMPLATE_FILE_NAME = "znrexp"
 
     def template_suffix(self):
         return "Expedition"
@@ -527,7 +717,7 @@ class ExpeditionTemplate(NormalTemplate):
                 image=self.image,
                 layer=name,
                 text_contents=self.layout.name,
-                text_colour=get_text_layer_colour(name),
+                text_colour=self._colour(name),
                 font_name=FONT_NAME_BELEREN,
             ),
             ExpansionSymbolField(
@@ -541,7 +731,7 @@ class ExpeditionTemplate(NormalTemplate):
                 image=self.image,
                 layer=type_line,
                 text_contents=self.layout.type_line,
-                text_colour=get_text_layer_colour(type_line),
+                text_colour=self._colour(type_line),
                 reference_layer=expansion_symbol,
                 font_name=FONT_NAME_BELEREN,
             ),
@@ -554,7 +744,7 @@ class ExpeditionTemplate(NormalTemplate):
                 image=self.image,
                 layer=rules_text,
                 text_contents=self.layout.oracle_text,
-                text_colour=get_text_layer_colour(rules_text),
+                text_colour=self._colour(rules_text),
                 flavour_text=self.layout.flavour_text,
                 is_centred=False,
                 reference_layer=self._layer(text_and_icons, LayerNames.TEXTBOX_REFERENCE),
@@ -563,29 +753,29 @@ class ExpeditionTemplate(NormalTemplate):
 
     def enable_frame_layers(self):
         twins = self._layer(self.image, LayerNames.TWINS)
-        self._layer(twins, self.layout.twins).set_visible(True)
+        self._set_visible(self._layer(twins, self.layout.twins), True)
 
         pinlines = self._layer(self.image, LayerNames.LAND_PINLINES_TEXTBOX)
-        self._layer(pinlines, self.layout.pinlines).set_visible(True)
+        self._set_visible(self._layer(pinlines, self.layout.pinlines), True)
 
         if self.is_legendary:
             crown = self._layer(self.image, LayerNames.LEGENDARY_CROWN)
-            self._layer(crown, self.layout.pinlines).set_visible(True)
+            self._set_visible(self._layer(crown, self.layout.pinlines), True)
             enable_active_layer_mask(pinlines)
 
             border = self._layer(self.image, LayerNames.BORDER)
-            self._layer(border, LayerNames.NORMAL_BORDER).set_visible(False)
-            self._layer(border, LayerNames.LEGENDARY_BORDER).set_visible(True)
+            self._set_visible(self._layer(border, LayerNames.NORMAL_BORDER), False)
+            self._set_visible(self._layer(border, LayerNames.LEGENDARY_BORDER), True)
 
 
 class SnowTemplate(NormalTemplate):
-    def template_file_name(self):
-        return "snow"
+    __slots__ = ()
+    TEMPLATE_FILE_NAME = "snow"
 
 
 class MiracleTemplate(NormalTemplate):
-    def template_file_name(self):
-        return "miracle"
+    __slots__ = ()
+    TEMPLATE_FILE_NAME = "miracle"
 
     def rules_text_and_pt_layers(self, text_and_icons):
         rules_text = self._layer(text_and_icons, LayerNames.RULES_TEXT_NONCREATURE)
@@ -594,7 +784,7 @@ class MiracleTemplate(NormalTemplate):
                 image=self.image,
                 layer=rules_text,
                 text_contents=self.layout.oracle_text,
-                text_colour=get_text_layer_colour(rules_text),
+                text_colour=self._colour(rules_text),
                 flavour_text=self.layout.flavour_text,
                 is_centred=False,
                 reference_layer=self._layer(text_and_icons, LayerNames.TEXTBOX_REFERENCE),
@@ -603,19 +793,16 @@ class MiracleTemplate(NormalTemplate):
 
 
 class TransformBackTemplate(NormalTemplate):
-    def template_file_name(self) -> str:
-        return "tf-back"
+    __slots__ = ()
+    TEMPLATE_FILE_NAME = "tf-back"
 
     def dfc_layer_group(self) -> str:
         return LayerNames.TF_BACK
 
     def __init__(self, layout, file, file_path):
         super().__init__(layout, file, file_path)
-        transform_group = self._layer(
-            self._layer(self.image, LayerNames.TEXT_AND_ICONS),
-            self.dfc_layer_group(),
-        )
-        self._layer(transform_group, self.layout.transform_icon).set_visible(True)
+        transform_group = self._layer(self.text_and_icons, self.dfc_layer_group())
+        self._set_visible(self._layer(transform_group, self.layout.transform_icon), True)
 
     def basic_text_layers(self, text_and_icons):
         if self.layout.transform_icon == LayerNames.MOON_ELDRAZI_DFC:
@@ -629,22 +816,14 @@ class TransformBackTemplate(NormalTemplate):
 
             power_toughness = self._layer(text_and_icons, LayerNames.POWER_TOUGHNESS)
 
-            # These layers are plain Gimp.Layer (not TextLayer) due to PSD->XCF import.
-            # Convert them to TextLayer before calling set_color().
-            name = ensure_text_layer(self.image, name)
-            type_line = ensure_text_layer(self.image, type_line)
-            power_toughness = ensure_text_layer(self.image, power_toughness)
-
-            name.set_color(rgb_black())
-            type_line.set_color(rgb_black())
-            power_toughness.set_color(rgb_black())
+            self._paint_black([name, type_line, power_toughness], shared_black())
 
         super().basic_text_layers(text_and_icons)
 
 
 class TransformFrontTemplate(TransformBackTemplate):
-    def template_file_name(self) -> str:
-        return "tf-front"
+    __slots__ = ("other_face_is_creature",)
+    TEMPLATE_FILE_NAME = "tf-front"
 
     def dfc_layer_group(self) -> str:
         return LayerNames.TF_FRONT
@@ -657,25 +836,20 @@ class TransformFrontTemplate(TransformBackTemplate):
 
         if self.other_face_is_creature:
             flipside_power_toughness = self._layer(
-                self._layer(self.image, LayerNames.TEXT_AND_ICONS),
-                LayerNames.FLIPSIDE_POWER_TOUGHNESS,
+                self.text_and_icons, LayerNames.FLIPSIDE_POWER_TOUGHNESS,
             )
             self.text_layers.append(
                 TextField(
                     image=self.image,
                     layer=flipside_power_toughness,
                     text_contents=f"{self.layout.other_face_power}/{self.layout.other_face_toughness}",
-                    text_colour=get_text_layer_colour(flipside_power_toughness),
+                    text_colour=self._colour(flipside_power_toughness),
                     font_name=FONT_NAME_BELEREN,
                 ),
             )
 
     def rules_text_and_pt_layers(self, text_and_icons):
-        is_centred = (
-            len(self.layout.flavour_text) <= 1
-            and len(self.layout.oracle_text) <= 70
-            and "\n" not in self.layout.oracle_text
-        )
+        is_centred = self._rules_text_is_centred()
 
         noncreature_copyright = self._layer(self.legal, LayerNames.NONCREATURE_COPYRIGHT)
         creature_copyright = self._layer(self.legal, LayerNames.CREATURE_COPYRIGHT)
@@ -690,15 +864,15 @@ class TransformFrontTemplate(TransformBackTemplate):
                 TextField(
                     image=self.image,
                     layer=power_toughness,
-                    text_contents=f"{self.layout.power}/{self.layout.toughness}",
-                    text_colour=get_text_layer_colour(power_toughness),
+                    text_contents=self.layout.pt_string,
+                    text_colour=self._colour(power_toughness),
                     font_name=FONT_NAME_BELEREN,
                 ),
                 CreatureFormattedTextArea(
                     image=self.image,
                     layer=rules_text,
                     text_contents=self.layout.oracle_text,
-                    text_colour=get_text_layer_colour(rules_text),
+                    text_colour=self._colour(rules_text),
                     flavour_text=self.layout.flavour_text,
                     is_centred=is_centred,
                     reference_layer=self._layer(text_and_icons, LayerNames.TEXTBOX_REFERENCE),
@@ -707,8 +881,8 @@ class TransformFrontTemplate(TransformBackTemplate):
                 ),
             ])
 
-            noncreature_copyright.set_visible(False)
-            creature_copyright.set_visible(True)
+            self._set_visible(noncreature_copyright, False)
+            self._set_visible(creature_copyright, True)
         else:
             rules_text = self._layer(text_and_icons, LayerNames.RULES_TEXT_NONCREATURE)
             if self.other_face_is_creature:
@@ -719,19 +893,19 @@ class TransformFrontTemplate(TransformBackTemplate):
                     image=self.image,
                     layer=rules_text,
                     text_contents=self.layout.oracle_text,
-                    text_colour=get_text_layer_colour(rules_text),
+                    text_colour=self._colour(rules_text),
                     flavour_text=self.layout.flavour_text,
                     is_centred=is_centred,
                     reference_layer=self._layer(text_and_icons, LayerNames.TEXTBOX_REFERENCE),
                 ),
             )
 
-            power_toughness.set_visible(False)
+            self._set_visible(power_toughness, False)
 
 
 class IxalanTemplate(NormalTemplate):
-    def template_file_name(self):
-        return "ixalan"
+    __slots__ = ()
+    TEMPLATE_FILE_NAME = "ixalan"
 
     def basic_text_layers(self, text_and_icons):
         name = self._layer(text_and_icons, LayerNames.NAME)
@@ -742,7 +916,7 @@ class IxalanTemplate(NormalTemplate):
                 image=self.image,
                 layer=name,
                 text_contents=self.layout.name,
-                text_colour=get_text_layer_colour(name),
+                text_colour=self._colour(name),
                 font_name=FONT_NAME_BELEREN,
             ),
             ExpansionSymbolField(
@@ -756,7 +930,7 @@ class IxalanTemplate(NormalTemplate):
                 image=self.image,
                 layer=type_line,
                 text_contents=self.layout.type_line,
-                text_colour=get_text_layer_colour(type_line),
+                text_colour=self._colour(type_line),
                 font_name=FONT_NAME_BELEREN,
             ),
         ])
@@ -768,7 +942,7 @@ class IxalanTemplate(NormalTemplate):
                 image=self.image,
                 layer=rules_text,
                 text_contents=self.layout.oracle_text,
-                text_colour=get_text_layer_colour(rules_text),
+                text_colour=self._colour(rules_text),
                 flavour_text=self.layout.flavour_text,
                 is_centred=False,
                 reference_layer=self._layer(text_and_icons, LayerNames.TEXTBOX_REFERENCE),
@@ -777,12 +951,12 @@ class IxalanTemplate(NormalTemplate):
 
     def enable_frame_layers(self):
         background = self._layer(self.image, LayerNames.BACKGROUND)
-        self._layer(background, self.layout.background).set_visible(True)
+        self._set_visible(self._layer(background, self.layout.background), True)
 
 
 class MDFCBackTemplate(NormalTemplate):
-    def template_file_name(self) -> str:
-        return "mdfc-back"
+    __slots__ = ()
+    TEMPLATE_FILE_NAME = "mdfc-back"
 
     def dfc_layer_group(self) -> str:
         return LayerNames.MDFC_BACK
@@ -790,191 +964,123 @@ class MDFCBackTemplate(NormalTemplate):
     def __init__(self, layout, file, file_path):
         super().__init__(layout, file, file_path)
         mdfc_group = self._layer(
-            self._layer(self.image, LayerNames.TEXT_AND_ICONS),
+            self.text_and_icons,
             self.dfc_layer_group(),
         )
         top = self._layer(mdfc_group, LayerNames.TOP)
         bottom = self._layer(mdfc_group, LayerNames.BOTTOM)
-        self._layer(top, self.layout.twins).set_visible(True)
-        self._layer(bottom, self.layout.other_face_twins).set_visible(True)
+        self._set_visible(self._layer(top, self.layout.twins), True)
+        self._set_visible(self._layer(bottom, self.layout.other_face_twins), True)
 
         left = self._layer(mdfc_group, LayerNames.LEFT)
         right = self._layer(mdfc_group, LayerNames.RIGHT)
-        self.text_layers.extend([
-            BasicFormattedTextField(
-                image=self.image,
-                layer=right,
-                text_contents=self.layout.other_face_right,
-                text_colour=get_text_layer_colour(right),
-            ),
-            ScaledTextField(
-                image=self.image,
-                layer=left,
-                text_contents=self.layout.other_face_left,
-                text_colour=get_text_layer_colour(left),
-                reference_layer=right,
-            ),
-        ])
+        self._add_text(BasicFormattedTextField, right, self.layout.other_face_right)
+        self._add_text(ScaledTextField, left, self.layout.other_face_left, reference_layer=right)
 
 
 class MDFCFrontTemplate(MDFCBackTemplate):
-    def template_file_name(self) -> str:
-        return "mdfc-front"
+    __slots__ = ()
+    TEMPLATE_FILE_NAME = "mdfc-front"
 
     def dfc_layer_group(self) -> str:
         return LayerNames.MDFC_FRONT
 
 
 class MutateTemplate(NormalTemplate):
-    def template_file_name(self):
-        return "mutate"
+    __slots__ = ()
+    TEMPLATE_FILE_NAME = "mutate"
 
     def __init__(self, layout, file, file_path):
-        split_rules_text = layout.oracle_text.split("\n")
-        layout.mutate_text = split_rules_text[0]
-        layout.oracle_text = "\n".join(split_rules_text[1:])
+        # the first line is the mutate ability, the rest is the regular rules text
+        layout.mutate_text, _, layout.oracle_text = layout.oracle_text.partition("\n")
 
         super().__init__(layout, file, file_path)
 
-        text_and_icons = self._layer(self.image, LayerNames.TEXT_AND_ICONS)
-        mutate = self._layer(text_and_icons, LayerNames.MUTATE)
-        self.text_layers.append(
-            FormattedTextArea(
-                image=self.image,
-                layer=mutate,
-                text_contents=self.layout.mutate_text,
-                text_colour=get_text_layer_colour(mutate),
-                flavour_text=self.layout.flavour_text,
-                is_centred=False,
-                reference_layer=self._layer(text_and_icons, LayerNames.MUTATE_REFERENCE),
-            ),
+        text_and_icons = self.text_and_icons
+        self._add_text(
+            FormattedTextArea,
+            self._layer(text_and_icons, LayerNames.MUTATE),
+            self.layout.mutate_text,
+            flavour_text=self.layout.flavour_text,
+            is_centred=False,
+            reference_layer=self._layer(text_and_icons, LayerNames.MUTATE_REFERENCE),
         )
 
 
 class AdventureTemplate(NormalTemplate):
-    def template_file_name(self):
-        return "adventure"
+    __slots__ = ()
+    TEMPLATE_FILE_NAME = "adventure"
 
     def __init__(self, layout, file, file_path):
         super().__init__(layout, file, file_path)
 
-        text_and_icons = self._layer(self.image, LayerNames.TEXT_AND_ICONS)
+        text_and_icons = self.text_and_icons
         name = self._layer(text_and_icons, LayerNames.NAME_ADVENTURE)
         mana_cost = self._layer(text_and_icons, LayerNames.MANA_COST_ADVENTURE)
         rules_text = self._layer(text_and_icons, LayerNames.RULES_TEXT_ADVENTURE)
         type_line = self._layer(text_and_icons, LayerNames.TYPE_LINE_ADVENTURE)
-        self.text_layers.extend([
-            BasicFormattedTextField(
-                image=self.image,
-                layer=mana_cost,
-                text_contents=self.layout.adventure.mana_cost,
-                text_colour=rgb_black(),
-            ),
-            ScaledTextField(
-                image=self.image,
-                layer=name,
-                text_contents=self.layout.adventure.name,
-                text_colour=get_text_layer_colour(name),
-                reference_layer=mana_cost,
-                font_name=FONT_NAME_BELEREN,
-            ),
-            FormattedTextArea(
-                image=self.image,
-                layer=rules_text,
-                text_contents=self.layout.adventure.oracle_text,
-                text_colour=get_text_layer_colour(rules_text),
-                flavour_text="",
-                is_centred=False,
-                reference_layer=self._layer(text_and_icons, LayerNames.TEXTBOX_REFERENCE_ADVENTURE),
-            ),
-            TextField(
-                image=self.image,
-                layer=type_line,
-                text_contents=self.layout.adventure.type_line,
-                text_colour=get_text_layer_colour(type_line),
-                font_name=FONT_NAME_BELEREN,
-            ),
-        ])
+        adventure = self.layout.adventure
+        self._add_text(BasicFormattedTextField, mana_cost, adventure.mana_cost, text_colour=shared_black())
+        self._add_text(
+            ScaledTextField, name, adventure.name,
+            reference_layer=mana_cost, font_name=FONT_NAME_BELEREN,
+        )
+        self._add_text(
+            FormattedTextArea, rules_text, adventure.oracle_text,
+            flavour_text="",
+            is_centred=False,
+            reference_layer=self._layer(text_and_icons, LayerNames.TEXTBOX_REFERENCE_ADVENTURE),
+        )
+        self._add_text(TextField, type_line, adventure.type_line, font_name=FONT_NAME_BELEREN)
 
 
 class LevelerTemplate(NormalTemplate):
-    def template_file_name(self):
-        return "leveler"
+    __slots__ = ()
+    TEMPLATE_FILE_NAME = "leveler"
+    FRAME_PATH = (
+        (LayerNames.TWINS, "twins"),
+        (LayerNames.PT_AND_LEVEL_BOXES, "twins"),
+        (LayerNames.PINLINES_TEXTBOX, "pinlines"),
+        (LayerNames.BACKGROUND, "background"),
+    )
 
     def rules_text_and_pt_layers(self, text_and_icons):
         leveler_text_group = self._layer(text_and_icons, "Leveler Text")
-        self.text_layers.extend([
-            BasicFormattedTextField(
-                image=self.image,
-                layer=self._layer(leveler_text_group, "Rules Text - Level Up"),
-                text_contents=self.layout.level_up_text,
-                text_colour=rgb_black(),
-            ),
-            TextField(
-                image=self.image,
-                layer=self._layer(leveler_text_group, "Top Power / Toughness"),
-                text_contents=f"{self.layout.power}/{self.layout.toughness}",
-                text_colour=rgb_black(),
-                font_name=FONT_NAME_BELEREN,
-            ),
-            TextField(
-                image=self.image,
-                layer=self._layer(leveler_text_group, "Middle Level"),
-                text_contents=self.layout.middle_level,
-                text_colour=rgb_black(),
-            ),
-            TextField(
-                image=self.image,
-                layer=self._layer(leveler_text_group, "Middle Power / Toughness"),
-                text_contents=self.layout.middle_power_toughness,
-                text_colour=rgb_black(),
-                font_name=FONT_NAME_BELEREN,
-            ),
-            BasicFormattedTextField(
-                image=self.image,
-                layer=self._layer(leveler_text_group, "Rules Text - Levels X-Y"),
-                text_contents=self.layout.levels_x_y_text,
-                text_colour=rgb_black(),
-            ),
-            TextField(
-                image=self.image,
-                layer=self._layer(leveler_text_group, "Bottom Level"),
-                text_contents=self.layout.bottom_level,
-                text_colour=rgb_black(),
-            ),
-            TextField(
-                image=self.image,
-                layer=self._layer(leveler_text_group, "Bottom Power / Toughness"),
-                text_contents=self.layout.bottom_power_toughness,
-                text_colour=rgb_black(),
-                font_name=FONT_NAME_BELEREN,
-            ),
-            BasicFormattedTextField(
-                image=self.image,
-                layer=self._layer(leveler_text_group, "Rules Text - Levels Z+"),
-                text_contents=self.layout.levels_z_plus_text,
-                text_colour=rgb_black(),
-            ),
-        ])
+        layout = self.layout
+        fields = (
+            (BasicFormattedTextField, "Rules Text - Level Up", layout.level_up_text, {}),
+            (TextField, "Top Power / Toughness", layout.pt_string, {"font_name": FONT_NAME_BELEREN}),
+            (TextField, "Middle Level", layout.middle_level, {}),
+            (TextField, "Middle Power / Toughness", layout.middle_power_toughness,
+             {"font_name": FONT_NAME_BELEREN}),
+            (BasicFormattedTextField, "Rules Text - Levels X-Y", layout.levels_x_y_text, {}),
+            (TextField, "Bottom Level", layout.bottom_level, {}),
+            (TextField, "Bottom Power / Toughness", layout.bottom_power_toughness,
+             {"font_name": FONT_NAME_BELEREN}),
+            (BasicFormattedTextField, "Rules Text - Levels Z+", layout.levels_z_plus_text, {}),
+        )
+        for cls, layer_name, text_contents, extra in fields:
+            self._add_text(
+                cls, self._layer(leveler_text_group, layer_name), text_contents,
+                text_colour=shared_black(), **extra,
+            )
         self.exit_early = True
 
     def enable_frame_layers(self):
-        twins = self._layer(self.image, LayerNames.TWINS)
-        self._layer(twins, self.layout.twins).set_visible(True)
-
-        pt_box = self._layer(self.image, LayerNames.PT_AND_LEVEL_BOXES)
-        self._layer(pt_box, self.layout.twins).set_visible(True)
-
-        pinlines = self._layer(self.image, LayerNames.PINLINES_TEXTBOX)
-        self._layer(pinlines, self.layout.pinlines).set_visible(True)
-
-        background = self._layer(self.image, LayerNames.BACKGROUND)
-        self._layer(background, self.layout.background).set_visible(True)
+        self._enable_frame_path()
 
 
 class SagaTemplate(NormalTemplate):
-    def template_file_name(self):
-        return "saga"
+    __slots__ = ()
+    TEMPLATE_FILE_NAME = "saga"
+    USES_SCRYFALL_SCAN = True
+    FRAME_PATH = (
+        (LayerNames.TWINS, "twins"),
+        (LayerNames.PINLINES_AND_SAGA_STRIPE, "pinlines"),
+        (LayerNames.TEXTBOX, "background"),
+        (LayerNames.BACKGROUND, "background"),
+    )
+    _SAGA_STAGES = ("I", "II", "III", "IV")
 
     def __init__(self, layout, file, file_path):
         super().__init__(layout, file, file_path)
@@ -982,34 +1088,18 @@ class SagaTemplate(NormalTemplate):
 
     def rules_text_and_pt_layers(self, text_and_icons):
         saga_text_group = self._layer(text_and_icons, "Saga")
-        stages = ["I", "II", "III", "IV"]
 
-        for i, saga_line in enumerate(self.layout.saga_lines):
-            stage_group = self._layer(saga_text_group, stages[i])
-            stage_group.set_visible(True)
-            self.text_layers.append(
-                BasicFormattedTextField(
-                    image=self.image,
-                    layer=self._layer(stage_group, "Text"),
-                    text_contents=saga_line,
-                    text_colour=rgb_black(),
-                ),
+        for saga_line, stage_name in zip(self.layout.saga_lines, self._SAGA_STAGES):
+            stage_group = self._layer(saga_text_group, stage_name)
+            self._set_visible(stage_group, True)
+            self._add_text(
+                BasicFormattedTextField, self._layer(stage_group, "Text"), saga_line, text_colour=shared_black(),
             )
 
         self.exit_early = True
 
     def enable_frame_layers(self):
-        twins = self._layer(self.image, LayerNames.TWINS)
-        self._layer(twins, self.layout.twins).set_visible(True)
-
-        pinlines = self._layer(self.image, LayerNames.PINLINES_AND_SAGA_STRIPE)
-        self._layer(pinlines, self.layout.pinlines).set_visible(True)
-
-        textbox = self._layer(self.image, LayerNames.TEXTBOX)
-        self._layer(textbox, self.layout.background).set_visible(True)
-
-        background = self._layer(self.image, LayerNames.BACKGROUND)
-        self._layer(background, self.layout.background).set_visible(True)
+        self._enable_frame_path()
 
 
 
@@ -1019,126 +1109,121 @@ class SagaTemplate(NormalTemplate):
 class PlaneswalkerTemplate(ChilliBaseTemplate):
     """Planeswalker template - 3 or 4 loyalty abilities."""
 
-    def template_file_name(self) -> str:
-        return "pw"
+    __slots__ = ("docref",)
+    TEMPLATE_FILE_NAME = "pw"
+    USES_SCRYFALL_SCAN = True
+    FRAME_PATH = (
+        (LayerNames.TWINS, "twins"),
+        (LayerNames.PINLINES, "pinlines"),
+        (LayerNames.BACKGROUND, "background"),
+    )
+    # ability groups, in the order the abilities appear in the oracle text
+    _ABILITY_GROUPS = (
+        LayerNames.FIRST_ABILITY,
+        LayerNames.SECOND_ABILITY,
+        LayerNames.THIRD_ABILITY,
+        LayerNames.FOURTH_ABILITY,
+    )
 
     def __init__(self, layout, file, file_path):
         super().__init__(layout, file, file_path)
 
         self.exit_early = True
 
-        self.art_reference = self._layer(self.image, LayerNames.PLANESWALKER_ART_FRAME)
+        art_frame_name = LayerNames.PLANESWALKER_ART_FRAME
         if self.layout.is_colourless:
-            self.art_reference = self._layer(self.image, LayerNames.FULL_ART_FRAME)
+            art_frame_name = LayerNames.FULL_ART_FRAME
+        self.art_reference = self._layer(self.image, art_frame_name)
 
-        ability_array = self.layout.oracle_text.split("\n")
-        num_abilities = 3
-        if len(ability_array) > 3:
-            num_abilities = 4
+        # at most four abilities are ever laid out, so don't split the rest
+        ability_array = self.layout.oracle_text.split("\n", 4)[:4]
 
         # docref for everything but legal and art reference is based on number of abilities
-        self.docref = self._layer(self.image, "pw-" + str(num_abilities))
-        self.docref.set_visible(True)
+        self.docref = self._layer(self.image, "pw-4" if len(ability_array) > 3 else "pw-3")
+        self._set_visible(self.docref, True)
 
         text_and_icons = self._layer(self.docref, LayerNames.TEXT_AND_ICONS)
         self.basic_text_layers(text_and_icons)
 
-        # planeswalker ability layers
-        group_names = [
-            LayerNames.FIRST_ABILITY,
-            LayerNames.SECOND_ABILITY,
-            LayerNames.THIRD_ABILITY,
-            LayerNames.FOURTH_ABILITY,
-        ]
         loyalty_group = self._layer(self.docref, LayerNames.LOYALTY_GRAPHICS)
+        self.ability_layers(loyalty_group, ability_array)
 
-        for i in range(min(len(ability_array), 4)):
-            ability_group = self._layer(loyalty_group, group_names[i])
+        # starting loyalty
+        starting_loyalty_group = self._layer(loyalty_group, LayerNames.STARTING_LOYALTY)
+        self.text_layers.append(
+            TextField(
+                image=self.image,
+                layer=self._layer(starting_loyalty_group, LayerNames.TEXT),
+                text_contents=self.layout.loyalty,
+                text_colour=shared_white(),
+            )
+        )
+
+        # paste scryfall scan
+        self.paste_scryfall_scan(
+            self._layer(self.image, LayerNames.SCRYFALL_SCAN_FRAME), file_path
+        )
 
-            ability_text = ability_array[i]
+    def ability_layers(self, loyalty_group, ability_array):
+        for group_name, ability_text in zip(self._ABILITY_GROUPS, ability_array):
+            ability_group = self._layer(loyalty_group, group_name)
             static_text_layer = self._layer(ability_group, LayerNames.STATIC_TEXT)
             ability_text_layer = self._layer(ability_group, LayerNames.ABILITY_TEXT)
             ability_layer = ability_text_layer
-            colon_index = ability_text.find(": ")
+            loyalty_match = _LOYALTY_RE.match(ability_text)
 
             # determine if this is a static or activated ability by the presence of ":" near the start
-            if 0 < colon_index < 5:
+            if loyalty_match is not None:
                 # activated ability - determine which loyalty group to enable
                 loyalty_graphic = self._layer(ability_group, ability_text[0])
-                loyalty_graphic.set_visible(True)
+                self._set_visible(loyalty_graphic, True)
                 self.text_layers.append(
                     TextField(
                         image=self.image,
                         layer=self._layer(loyalty_graphic, LayerNames.COST),
-                        text_contents=ability_text[:colon_index],
-                        text_colour=rgb_white(),
+                        text_contents=loyalty_match.group(1),
+                        text_colour=shared_white(),
                     )
                 )
-                ability_text = ability_text[colon_index + 2:]
+                ability_text = loyalty_match.group(2)
             else:
                 # static ability
                 ability_layer = static_text_layer
-                ability_text_layer.set_visible(False)
-                static_text_layer.set_visible(True)
-                self._layer(ability_group, "Colon").set_visible(False)
+                self._set_visible(ability_text_layer, False)
+                self._set_visible(static_text_layer, True)
+                self._set_visible(self._layer(ability_group, "Colon"), False)
 
             self.text_layers.append(
                 BasicFormattedTextField(
                     image=self.image,
                     layer=ability_layer,
                     text_contents=ability_text,
-                    text_colour=get_text_layer_colour(ability_layer),
+                    text_colour=self._colour(ability_layer),
                 )
             )
 
-        # starting loyalty
-        starting_loyalty_group = self._layer(loyalty_group, LayerNames.STARTING_LOYALTY)
-        self.text_layers.append(
-            TextField(
-                image=self.image,
-                layer=self._layer(starting_loyalty_group, LayerNames.TEXT),
-                text_contents=self.layout.scryfall.get("loyalty", "") if isinstance(self.layout.scryfall, dict) else getattr(self.layout.scryfall, "loyalty", ""),
-                text_colour=rgb_white(),
-            )
-        )
-
-        # paste scryfall scan
-        self.paste_scryfall_scan(
-            self._layer(self.image, LayerNames.SCRYFALL_SCAN_FRAME), file_path
-        )
+    def _frame_root(self):
+        # frame groups live under the pw-3 / pw-4 docref group
+        return self.docref
 
     def enable_frame_layers(self):
-        # twins
-        twins = self._layer(self.docref, LayerNames.TWINS)
-        self._layer(twins, self.layout.twins).set_visible(True)
-
-        # pinlines
-        pinlines = self._layer(self.docref, LayerNames.PINLINES)
-        self._layer(pinlines, self.layout.pinlines).set_visible(True)
-
-        # background
-        self.enable_background()
-
-    def enable_background(self):
-        background = self._layer(self.docref, LayerNames.BACKGROUND)
-        self._layer(background, self.layout.background).set_visible(True)
+        self._enable_frame_path()
 
 
 class PlaneswalkerExtendedTemplate(PlaneswalkerTemplate):
     """Extended art planeswalker - no background textures."""
 
-    def template_file_name(self) -> str:
-        return "pw-extended"
-
-    def enable_background(self):
-        pass
+    __slots__ = ()
+    TEMPLATE_FILE_NAME = "pw-extended"
+    FRAME_PATH = PlaneswalkerTemplate.FRAME_PATH[:2]
 
 
 class PlanarTemplate(ChilliBaseTemplate):
     """Planechase card template - planes and phenomena."""
 
-    def template_file_name(self):
-        return "planar"
+    __slots__ = ()
+    TEMPLATE_FILE_NAME = "planar"
+    USES_SCRYFALL_SCAN = True
 
     def __init__(self, layout, file, file_path):
         super().__init__(layout, file, file_path)
@@ -1154,7 +1239,7 @@ class PlanarTemplate(ChilliBaseTemplate):
         )
 
         # card name, type line, expansion symbol
-        text_and_icons = self._layer(self.image, LayerNames.TEXT_AND_ICONS)
+        text_and_icons = self.text_and_icons
         name = self._layer(text_and_icons, LayerNames.NAME)
         type_line = self._layer(text_and_icons, LayerNames.TYPE_LINE)
         expansion_symbol = self._layer(text_and_icons, LayerNames.EXPANSION_SYMBOL)
@@ -1165,14 +1250,14 @@ class PlanarTemplate(ChilliBaseTemplate):
                 image=self.image,
                 layer=name,
                 text_contents=self.layout.name,
-                text_colour=get_text_layer_colour(name),
+                text_colour=self._colour(name),
                 font_name=FONT_NAME_BELEREN,
             ),
             ScaledTextField(
                 image=self.image,
                 layer=type_line,
                 text_contents=self.layout.type_line,
-                text_colour=get_text_layer_colour(type_line),
+                text_colour=self._colour(type_line),
                 reference_layer=expansion_symbol,
                 font_name=FONT_NAME_BELEREN,
             ),
@@ -1188,28 +1273,28 @@ class PlanarTemplate(ChilliBaseTemplate):
                     image=self.image,
                     layer=static_ability,
                     text_contents=self.layout.oracle_text,
-                    text_colour=get_text_layer_colour(static_ability),
+                    text_colour=self._colour(static_ability),
                 )
             )
             textbox = self._layer(self.image, LayerNames.TEXTBOX)
             disable_active_layer_mask(textbox)
-            self._layer(text_and_icons, LayerNames.CHAOS_SYMBOL).set_visible(False)
-            chaos_ability.set_visible(False)
+            self._set_visible(self._layer(text_and_icons, LayerNames.CHAOS_SYMBOL), False)
+            self._set_visible(chaos_ability, False)
         else:
             # plane card - split oracle text on last newline
-            linebreak_index = self.layout.oracle_text.rfind("\n")
+            static_text, _, chaos_text = self.layout.oracle_text.rpartition("\n")
             self.text_layers.extend([
                 BasicFormattedTextField(
                     image=self.image,
                     layer=static_ability,
-                    text_contents=self.layout.oracle_text[:linebreak_index],
-                    text_colour=get_text_layer_colour(static_ability),
+                    text_contents=static_text,
+                    text_colour=self._colour(static_ability),
                 ),
                 BasicFormattedTextField(
                     image=self.image,
                     layer=chaos_ability,
-                    text_contents=self.layout.oracle_text[linebreak_index + 1:],
-                    text_colour=get_text_layer_colour(chaos_ability),
+                    text_contents=chaos_text,
+                    text_colour=self._colour(chaos_ability),
                 ),
             ])
 
@@ -1222,11 +1307,20 @@ class PlanarTemplate(ChilliBaseTemplate):
         pass
 
 
+def _classify_rules_text(oracle_text, flavour_text):
+    """Pick the token rules text group: full art, a single line, or a text box."""
+    if not oracle_text and not flavour_text:
+        return LayerNames.FULL_ART
+    if (not oracle_text or not flavour_text) and "\n" not in oracle_text and "\n" not in flavour_text:
+        return LayerNames.ONE_LINE_RULES_TEXT
+    return LayerNames.RULES_TEXT
+
+
 class TokenTemplate(BaseTemplate):
     """Token card template."""
 
-    def template_file_name(self):
-        return "token"
+    __slots__ = ("is_creature", "is_legendary")
+    TEMPLATE_FILE_NAME = "token"
 
     def __init__(self, layout, file, file_path):
         super().__init__(layout, file, file_path)
@@ -1235,7 +1329,7 @@ class TokenTemplate(BaseTemplate):
         self.is_legendary = "Legendary" in self.layout.type_line
 
         self.art_reference = self._layer(self.image, LayerNames.ART_FRAME)
-        text_and_icons = self._layer(self.image, LayerNames.TEXT_AND_ICONS)
+        text_and_icons = self.text_and_icons
         type_line_and_rules_text = self._layer(self.image, LayerNames.TYPE_LINE_AND_RULES_TEXT)
         name_layer = self._layer(text_and_icons, LayerNames.NAME)
         self.text_layers.append(
@@ -1243,7 +1337,7 @@ class TokenTemplate(BaseTemplate):
                 image=self.image,
                 layer=name_layer,
                 text_contents=self.layout.name,
-                text_colour=get_text_layer_colour(name_layer),
+                text_colour=self._colour(name_layer),
                 font_name=FONT_NAME_BELEREN,
             )
         )
@@ -1257,60 +1351,54 @@ class TokenTemplate(BaseTemplate):
                 TextField(
                     image=self.image,
                     layer=power_toughness_layer,
-                    text_contents=str(self.layout.power) + "/" + str(self.layout.toughness),
-                    text_colour=rgb_white(),
+                    text_contents=self.layout.pt_string,
+                    text_colour=shared_white(),
                     font_name=FONT_NAME_BELEREN,
                 )
             )
             enable_active_vector_mask(type_line_and_rules_text)
-            noncreature_copyright.set_visible(False)
-            creature_copyright.set_visible(True)
+            self._set_visible(noncreature_copyright, False)
+            self._set_visible(creature_copyright, True)
         else:
-            power_toughness_layer.set_visible(False)
+            self._set_visible(power_toughness_layer, False)
             disable_active_vector_mask(type_line_and_rules_text)
-            noncreature_copyright.set_visible(True)
-            creature_copyright.set_visible(False)
+            self._set_visible(noncreature_copyright, True)
+            self._set_visible(creature_copyright, False)
 
         # rules text selection
-        if self.layout.oracle_text == "" and self.layout.flavour_text == "":
-            rules_text_group = self._layer(type_line_and_rules_text, LayerNames.FULL_ART)
-        elif (
-            "\n" not in self.layout.oracle_text
-            and "\n" not in self.layout.flavour_text
-            and (self.layout.oracle_text == "" or self.layout.flavour_text == "")
-        ):
-            rules_text_group = self._layer(type_line_and_rules_text, LayerNames.ONE_LINE_RULES_TEXT)
+        rules_text_kind = _classify_rules_text(self.layout.oracle_text, self.layout.flavour_text)
+        rules_text_group = self._layer(type_line_and_rules_text, rules_text_kind)
+        if rules_text_kind == LayerNames.ONE_LINE_RULES_TEXT:
             self.text_layers.append(
                 FormattedTextField(
                     image=self.image,
                     layer=self._layer(rules_text_group, LayerNames.RULES_TEXT),
                     text_contents=self.layout.oracle_text,
-                    text_colour=rgb_white(),
+                    text_colour=shared_white(),
                     flavour_text=self.layout.flavour_text,
                     is_centred=False,
                 )
             )
-        else:
-            rules_text_group = self._layer(type_line_and_rules_text, LayerNames.RULES_TEXT)
+        elif rules_text_kind == LayerNames.RULES_TEXT:
             self.text_layers.append(
                 FormattedTextArea(
                     image=self.image,
                     layer=self._layer(rules_text_group, LayerNames.RULES_TEXT),
                     text_contents=self.layout.oracle_text,
-                    text_colour=rgb_white(),
+                    text_colour=shared_white(),
                     flavour_text=self.layout.flavour_text,
                     is_centred=False,
                     reference_layer=self._layer(rules_text_group, LayerNames.TEXTBOX_REFERENCE),
                 )
             )
 
-        rules_text_group.set_visible(True)
+        self._set_visible(rules_text_group, True)
         self.text_layers.append(
             TextField(
                 image=self.image,
                 layer=self._layer(rules_text_group, LayerNames.TYPE_LINE),
                 text_contents=self.layout.type_line,
-                text_colour=rgb_white(),
+                text_colour=shared_white(),
                 font_name=FONT_NAME_BELEREN,
             )
         )
@@ -1325,14 +1413,14 @@ class TokenTemplate(BaseTemplate):
             frame_group = self._layer(frame_group, LayerNames.CREATURE)
         else:
             frame_group = self._layer(frame_group, LayerNames.NON_CREATURE)
-        self._layer(frame_group, self.layout.pinlines).set_visible(True)
+        self._set_visible(self._layer(frame_group, self.layout.pinlines), True)
 
 
 class BasicLandTemplate(BaseTemplate):
     """Basic land template - full art, no text except legal."""
 
-    def template_file_name(self) -> str:
-        return "basic"
+    __slots__ = ()
+    TEMPLATE_FILE_NAME = "basic"
 
     def template_suffix(self):
         return self.layout.artist
@@ -1342,25 +1430,25 @@ class BasicLandTemplate(BaseTemplate):
         self.art_reference = self._layer(self.image, LayerNames.BASIC_ART_FRAME)
 
     def enable_frame_layers(self):
-        self._layer(self.image, self.layout.name).set_visible(True)
+        self._set_visible(self._layer(self.image, self.layout.name), True)
 
 
 class BasicLandTherosTemplate(BasicLandTemplate):
     """Theros Nyx full-art basic land."""
 
-    def template_file_name(self) -> str:
-        return "basic-theros"
+    __slots__ = ()
+    TEMPLATE_FILE_NAME = "basic-theros"
 
 
 class BasicLandUnstableTemplate(BasicLandTemplate):
     """Unstable borderless basic land."""
 
-    def template_file_name(self) -> str:
-        return "basic-unstable"
+    __slots__ = ()
+    TEMPLATE_FILE_NAME = "basic-unstable"
 
 
 class BasicLandClassicTemplate(BasicLandTemplate):
     """7th Edition classic frame basic land."""
 
-    def template_file_name(self) -> str:
-        return "basic-classic"
+    __slots__ = ()
+    TEMPLATE_FILE_NAME = "basic-classic"
@@ -1,16 +1,17 @@
+from functools import lru_cache
+
 import gi
 
 gi.require_version('Gimp', '3.0')
 from gi.repository import Gimp, Gegl
 
 from src.helpers import (
-    compute_layer_dimensions,
     compute_text_layer_dimensions,
     compute_text_layer_bounds,
     get_layer_bounds,
     find_layer_by_name,
-    rgb_black,
-    rgb_white,
+    shared_black,
+    shared_white,
     apply_stroke,
     clip_layer_to_alpha,
     create_new_layer,
@@ -38,6 +39,39 @@ FONT_SIZE_EXPANSION = 130.0        # Expansion Symbol: 155×164  → ~80% of 164
 FONT_SIZE_ARTIST = 44.0            # Artist layer: 223×56       → ~80% of 56
 FONT_SIZE_DEFAULT = 40.0           # Fallback for any unspecified field
 
+# Names, type lines and P/T strings repeat across a batch, and text colours come
+# from a handful of frame colours, so both conversions are worth memoizing.
+@lru_cache(maxsize=512)
+def _escape_cached(text):
+    return escape_pango(text)
+
+
+@lru_cache(maxsize=512)
+def _hex_cached(rgb):
+    return rgb_to_hex(rgb)
+
+
+@lru_cache(maxsize=512)
+def _parse_flavour(flavour_text, text_length):
+    """
+    Split *-delimited italic runs out of flavour text. Returns the flavour with
+    the asterisks removed, the runs to italicise, and the flavour's index in the
+    combined rules + flavour string (-1 when there is no flavour).
+    """
+    if len(flavour_text) <= 1:
+        return flavour_text, (), -1
+    flavour_text_split = flavour_text.split("*")
+    if len(flavour_text_split) == 1:
+        return flavour_text, (flavour_text,), text_length
+    italics = tuple(part for part in flavour_text_split[::2] if part != "")
+    return "".join(flavour_text_split), italics, text_length
+
+
+@lru_cache(maxsize=128)
+def _markup_span(family, color_attr):
+    return f'<span font_family="{family}"{color_attr}>', '</span>'
+
+
 def _dimension_height(dimensions):
     if hasattr(dimensions, "height"):
         return float(dimensions.height)
@@ -66,6 +100,12 @@ def _bound_value(bound):
 def _bounds_to_float(bounds):
     if len(bounds) < 4:
         return (0.0, 0.0, 0.0, 0.0)
+    # get_layer_bounds() hands back plain numbers, so convert them in one go
+    # and only probe each element for a unit-style .as() when that fails.
+    try:
+        return tuple(map(float, bounds[:4]))
+    except (TypeError, ValueError):
+        pass
     return (
         _bound_value(bounds[0]),
         _bound_value(bounds[1]),
@@ -74,8 +114,26 @@ def _bounds_to_float(bounds):
     )
 
 
-def _font_size_tuple(layer):
-    font_size = layer.get_font_size()
+# id(reference layer) -> (layer, (left, top, right, bottom)). Text box and P/T
+# reference layers are positioning guides that rendering never moves or
+# resizes, so their geometry is read from GIMP once per card; render() calls
+# clear_reference_bounds() when the card is done.
+_reference_bounds = {}
+
+
+def _reference_layer_bounds(layer):
+    entry = _reference_bounds.get(id(layer))
+    if entry is None:
+        entry = (layer, _bounds_to_float(get_layer_bounds(layer)))
+        _reference_bounds[id(layer)] = entry
+    return entry[1]
+
+
+def clear_reference_bounds():
+    _reference_bounds.clear()
+
+
+def _parse_font_size(font_size):
     if isinstance(font_size, (tuple, list)):
         if len(font_size) >= 3 and isinstance(font_size[1], (int, float)):
             return float(font_size[1]), font_size[2]
@@ -88,17 +146,36 @@ def _font_size_tuple(layer):
     return 0.0, Gimp.Unit.point()
 
 
+def _pick_font_size_parser(font_size):
+    # A given GIMP build always returns the same shape from get_font_size(),
+    # so look at the first result and unpack later ones without re-checking.
+    if isinstance(font_size, (tuple, list)):
+        if len(font_size) >= 3 and isinstance(font_size[1], (int, float)):
+            return lambda value: (float(value[1]), value[2])
+        if len(font_size) == 2 and isinstance(font_size[0], (int, float)):
+            return lambda value: (float(value[0]), value[1])
+    return _parse_font_size
+
+
+_font_size_parser = None
+
+
+def _font_size_tuple(layer):
+    global _font_size_parser
+    font_size = layer.get_font_size()
+    if _font_size_parser is None:
+        _font_size_parser = _pick_font_size_parser(font_size)
+    return _font_size_parser(font_size)
+
+
 def _set_relative_y(layer, delta):
+    # get_offsets() returns (x, y) or (success, x, y); either way the
+    # coordinates are the last two elements.
     offsets = layer.get_offsets()
-    if isinstance(offsets, (tuple, list)) and len(offsets) >= 3:
-        x = int(offsets[1])
-        y = int(offsets[2])
-    elif isinstance(offsets, (tuple, list)) and len(offsets) >= 2:
-        x = int(offsets[0])
-        y = int(offsets[1])
-    else:
-        x = 0
-        y = 0
+    try:
+        x, y = int(offsets[-2]), int(offsets[-1])
+    except (TypeError, IndexError):
+        x = y = 0
     layer.set_offsets(x, int(round(y + delta)))
 
 
@@ -109,47 +186,111 @@ def scale_text_right_overlap(layer, reference_layer):
     if reference_left < layer_left:
         return
 
+    max_right = reference_left - 24
+    if layer_right <= max_right:
+        return
+
     font_size, font_unit = _font_size_tuple(layer)
-    while layer_right > reference_left - 24 and font_size > 0:
-        font_size -= step_size
-        if font_size <= 0:
-            break
-        layer.set_font_size(font_size, font_unit)
-        layer_right = _bounds_to_float(get_layer_bounds(layer))[2]
+    fit_key = ("right", layer.get_markup() or layer.get_text(), font_size, layer_left, max_right)
+    fitted = _fitted_size_cache.get(fit_key)
+    if fitted is None:
+        # Bisect between the current size (overlapping) and 0 to one step's
+        # precision; each probe relayouts the text in GIMP.
+        lo, hi = 0.0, font_size
+        while hi - lo > step_size:
+            mid = (lo + hi) / 2.0
+            layer.set_font_size(mid, font_unit)
+            if _bounds_to_float(get_layer_bounds(layer))[2] > max_right:
+                hi = mid
+            else:
+                lo = mid
+        fitted = lo if lo > 0 else step_size
+        _remember(_fitted_size_cache, fit_key, fitted)
+    layer.set_font_size(fitted, font_unit)
+
+
+# (text layout key, font size) -> measured ink height. Batches see the same
+# rules text box and wording repeatedly (reprints, tokens, basic abilities),
+# and every probe in scale_text_to_fit_reference() is a full GIMP relayout.
+_text_height_cache = {}
+
+# Final font size chosen by a fitting search, keyed by the text, its starting
+# size and the space it had to fit in. A repeat skips the search entirely.
+_fitted_size_cache = {}
+
+# Entries kept per measurement cache. render() can be called on its own, with
+# nothing clearing the caches afterwards, so the oldest entry is dropped once
+# a cache is full.
+TEXT_MEASUREMENT_CACHE_SIZE = 4096
+
+
+def _remember(cache, key, value):
+    if len(cache) >= TEXT_MEASUREMENT_CACHE_SIZE:
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+
+def clear_text_measurement_cache():
+    _text_height_cache.clear()
+    _fitted_size_cache.clear()
+
+
+def _text_layout_key(layer):
+    """Everything besides font size that decides a text layer's wrapped height."""
+    return (layer.get_markup() or layer.get_text(), layer.get_width(), layer.get_line_spacing())
 
 
 def scale_text_to_fit_reference(image, layer, reference_layer):
     fine_step = 0.25
-    coarse_step = 4.0  # large step for fast initial convergence
     font_size, font_unit = _font_size_tuple(layer)
-    reference_height = _dimension_height(compute_layer_dimensions(reference_layer)) - 64.0
-    layer_height = _dimension_height(compute_text_layer_dimensions(image, layer))
-    scaled = False
-    # Phase 1: Coarse pass — step down quickly until text is near reference height.
-    # This avoids hundreds of slow 0.25px iterations when starting font is much too large.
-    while reference_height < layer_height and font_size > coarse_step:
-        scaled = True
-        font_size -= coarse_step
-        layer.set_font_size(font_size, font_unit)
-        layer_height = _dimension_height(compute_text_layer_dimensions(image, layer))
-    # Phase 2: If we overshot (text now smaller than reference), step back up once
-    if scaled and layer_height < reference_height:
-        font_size += coarse_step
-        layer.set_font_size(font_size, font_unit)
-        layer_height = _dimension_height(compute_text_layer_dimensions(image, layer))
-    # Phase 3: Fine pass — step down 0.25px for pixel-accurate fit
-    while reference_height < layer_height and font_size > 0:
-        scaled = True
-        font_size -= fine_step
-        if font_size <= 0:
-            break
-        layer.set_font_size(font_size, font_unit)
-        layer_height = _dimension_height(compute_text_layer_dimensions(image, layer))
-    return scaled
+    _, ref_top, _, ref_bottom = _reference_layer_bounds(reference_layer)
+    reference_height = ref_bottom - ref_top - 64.0
+    layout_key = _text_layout_key(layer)
+    fit_key = ("reference", layout_key, font_size, reference_height)
+    fitted = _fitted_size_cache.get(fit_key)
+    if fitted is not None:
+        if fitted != font_size:
+            layer.set_font_size(fitted, font_unit)
+            return True
+        return False
+    applied_size = font_size
+
+    def too_tall(size):
+        nonlocal applied_size
+        height = _text_height_cache.get((layout_key, size))
+        if height is None:
+            if size != applied_size:
+                layer.set_font_size(size, font_unit)
+                applied_size = size
+            height = _dimension_height(compute_text_layer_dimensions(image, layer))
+            _remember(_text_height_cache, (layout_key, size), height)
+        return height > reference_height
+
+    if not too_tall(font_size):
+        _remember(_fitted_size_cache, fit_key, font_size)
+        return False
+    # Bisect between a size known to be too tall (hi) and 0 until the bracket
+    # is one fine step wide. Every probe is a full text layout + ink
+    # measurement, so this takes ~10 probes where stepping down took dozens.
+    lo, hi = 0.0, font_size
+    while hi - lo > fine_step:
+        mid = (lo + hi) / 2.0
+        if too_tall(mid):
+            hi = mid
+        else:
+            lo = mid
+    # lo is the largest size found to fit; if nothing fits, bottom out at one
+    # fine step as the stepping search did. Skip the call when the last probe
+    # already left the layer at that size.
+    final_size = lo if lo > 0 else fine_step
+    _remember(_fitted_size_cache, fit_key, final_size)
+    if final_size != applied_size:
+        layer.set_font_size(final_size, font_unit)
+    return True
 
 
 def vertically_align_text(image, layer, reference_layer):
-    ref_left, ref_top, ref_right, ref_bottom = _bounds_to_float(get_layer_bounds(reference_layer))
+    _, ref_top, _, ref_bottom = _reference_layer_bounds(reference_layer)
     ref_height = ref_bottom - ref_top
 
     ink_bounds = _bounds_to_float(compute_text_layer_bounds(image, layer))
@@ -168,8 +309,8 @@ def vertically_align_text(image, layer, reference_layer):
 def vertically_nudge_creature_text(image, layer, reference_layer, top_reference_layer):
     _ = image
     layer_left, layer_top, layer_right, layer_bottom = _bounds_to_float(get_layer_bounds(layer))
-    pt_left, pt_top, pt_right, pt_bottom = _bounds_to_float(get_layer_bounds(reference_layer))
-    _, _, _, top_ref_bottom = _bounds_to_float(get_layer_bounds(top_reference_layer))
+    pt_left, pt_top, pt_right, pt_bottom = _reference_layer_bounds(reference_layer)
+    _, _, _, top_ref_bottom = _reference_layer_bounds(top_reference_layer)
 
     if layer_right < pt_left:
         return
@@ -187,6 +328,12 @@ def vertically_nudge_creature_text(image, layer, reference_layer, top_reference_
 
 
 class TextField:
+    # Templates build dozens of these per card; slots keep them compact.
+    __slots__ = (
+        "image", "layer", "text_contents", "text_colour", "font_name", "font_size",
+        "justification", "_original_right", "_original_top", "_original_bottom",
+    )
+
     def __init__(self, image, layer, text_contents, text_colour, font_name=None,
                  font_size=None, justification=None):
         self.image = image
@@ -205,7 +352,24 @@ class TextField:
         self._original_top = orig_bounds[1]
         self._original_bottom = orig_bounds[3]
 
+    def _is_empty(self):
+        return self.text_contents == ""
+
+    def _hide_if_empty(self):
+        # Nothing to draw: hide the placeholder instead of building a text
+        # layer, markup and measurements for an empty string.
+        if not self._is_empty():
+            return False
+        self.layer.set_visible(False)
+        return True
+
     def execute(self):
+        # The empty check lives here only; subclasses extend _render().
+        if self._hide_if_empty():
+            return
+        self._render()
+
+    def _render(self):
         self.layer = ensure_text_layer(
             self.image, self.layer, self.text_contents,
             font_size=self.font_size,
@@ -218,26 +382,23 @@ class TextField:
             # set_markup() uses the system Pango font map which resolves
             # fontconfig families correctly.
             family = get_pango_family(self.font_name)
-            escaped = escape_pango(self.text_contents)
+            escaped = _escape_cached(self.text_contents)
             color_attr = ''
             if self.text_colour is not None:
                 rgb = self.text_colour
                 if isinstance(rgb, (tuple, list)) and len(rgb) >= 3:
-                    color_attr = f' foreground="{rgb_to_hex(rgb)}"'
+                    color_attr = f' foreground="{_hex_cached(tuple(rgb[:3]))}"'
                 elif hasattr(rgb, 'get_rgba'):
                     rgba = rgb.get_rgba()
                     if isinstance(rgba, (tuple, list)) and len(rgba) >= 3:
-                        r, g, b = rgba[0], rgba[1], rgba[2]
-                        if max(r, g, b) <= 1.0:
-                            color_attr = f' foreground="{rgb_to_hex((int(round(r * 255)), int(round(g * 255)), int(round(b * 255))))}"'
-                        else:
-                            color_attr = f' foreground="{rgb_to_hex((int(round(r)), int(round(g)), int(round(b))))}"'
+                        scale = 255 if max(rgba[0], rgba[1], rgba[2]) <= 1.0 else 1
+                        rgb_ints = tuple(int(round(channel * scale)) for channel in rgba[:3])
+                        color_attr = f' foreground="{_hex_cached(rgb_ints)}"'
             # Set base color to white so GIMP's outer <span color="#RRGGBB"> wrapper
             # doesn't suppress inner foreground= attributes (see gimptextlayout.c:655)
-            self.layer.set_color(Gegl.Color.new("rgb(255,255,255)"))
-            self.layer.set_markup(
-                f'<span font_family="{family}"{color_attr}>{escaped}</span>'
-            )
+            self.layer.set_color(shared_white())
+            prefix, suffix = _markup_span(family, color_attr)
+            self.layer.set_markup(prefix + escaped + suffix)
         else:
             self.layer.set_text(self.text_contents)
             if self.text_colour is not None:
@@ -248,19 +409,23 @@ class TextField:
 
 
 class ScaledTextField(TextField):
+    __slots__ = ("reference_layer",)
+
     def __init__(self, image, layer, text_contents, text_colour, reference_layer, font_name=None, font_size=None):
         super().__init__(image, layer, text_contents, text_colour, font_name=font_name, font_size=font_size)
         self.reference_layer = reference_layer
 
-    def execute(self):
-        super().execute()
+    def _render(self):
+        super()._render()
         scale_text_right_overlap(self.layer, self.reference_layer)
 
 
 class ExpansionSymbolField(TextField):
+    __slots__ = ("rarity",)
+
     def __init__(self, image, layer, text_contents, rarity, font_name=None):
         super().__init__(
-            image, layer, text_contents, rgb_black(),
+            image, layer, text_contents, shared_black(),
             font_name=font_name,
             font_size=FONT_SIZE_EXPANSION,
         )
@@ -268,11 +433,11 @@ class ExpansionSymbolField(TextField):
         if rarity in (RARITY_BONUS, RARITY_SPECIAL):
             self.rarity = RARITY_MYTHIC
 
-    def execute(self):
-        super().execute()
+    def _render(self):
+        super()._render()
         stroke_weight = 6
         if self.rarity == RARITY_COMMON:
-            apply_stroke(self.image, self.layer, stroke_weight, rgb_white())
+            apply_stroke(self.image, self.layer, stroke_weight, shared_white())
             return
         # For non-common rarities, enable the rarity gradient overlay and
         # clip it to the glyph shape (emulating Photoshop clipping masks).
@@ -283,10 +448,12 @@ class ExpansionSymbolField(TextField):
                 mask_layer.set_visible(True)
                 # Clip the rarity gradient to the Keyrune glyph shape
                 clip_layer_to_alpha(self.image, self.layer, mask_layer)
-        apply_stroke(self.image, self.layer, stroke_weight, rgb_black())
+        apply_stroke(self.image, self.layer, stroke_weight, shared_black())
 
 
 class BasicFormattedTextField(TextField):
+    __slots__ = ()
+
     def __init__(self, image, layer, text_contents, text_colour,
                  font_size=None, justification=None):
         super().__init__(
@@ -295,8 +462,8 @@ class BasicFormattedTextField(TextField):
             justification=justification,
         )
 
-    def execute(self):
-        super().execute()
+    def _render(self):
+        super()._render()
         italic_text = generate_italics(self.text_contents)
         format_text(self.layer, self.text_contents, italic_text, -1, False)
         # Re-apply justification after format_text (which sets LEFT by default)
@@ -316,41 +483,44 @@ class BasicFormattedTextField(TextField):
 
 
 class FormattedTextField(TextField):
+    __slots__ = ("flavour_text", "is_centred", "_italic_text", "_flavour_index")
+
     def __init__(self, image, layer, text_contents, text_colour, flavour_text, is_centred):
         super().__init__(image, layer, text_contents, text_colour)
         self.flavour_text = ""
         if flavour_text is not None:
             self.flavour_text = str(flavour_text)
         self.is_centred = is_centred
+        # The italic runs and flavour split depend only on the text, so work
+        # them out once here rather than in each execute() override.
+        self.flavour_text, flavour_italics, self._flavour_index = _parse_flavour(
+            self.flavour_text, len(self.text_contents),
+        )
+        self._italic_text = generate_italics(self.text_contents)
+        self._italic_text.extend(flavour_italics)
 
-    def execute(self):
-        super().execute()
-        italic_text = generate_italics(self.text_contents)
-        flavour_index = -1
-
-        if len(self.flavour_text) > 1:
-            flavour_text_split = self.flavour_text.split("*")
-            if len(flavour_text_split) > 1:
-                for i in range(0, len(flavour_text_split), 2):
-                    if flavour_text_split[i] != "":
-                        italic_text.append(flavour_text_split[i])
-                self.flavour_text = "".join(flavour_text_split)
-            else:
-                italic_text.append(self.flavour_text)
-            flavour_index = len(self.text_contents)
-
+    def _format_text(self):
         format_text(
             self.layer,
             self.text_contents + "\n" + self.flavour_text,
-            italic_text,
-            flavour_index,
+            self._italic_text,
+            self._flavour_index,
             self.is_centred,
         )
         if self.is_centred:
             self.layer.set_justification(Gimp.TextJustification.CENTER)
 
+    def _is_empty(self):
+        return self.text_contents == "" and self.flavour_text == ""
+
+    def _render(self):
+        super()._render()
+        self._format_text()
+
 
 class FormattedTextArea(FormattedTextField):
+    __slots__ = ("reference_layer",)
+
     def __init__(
         self,
         image,
@@ -363,12 +533,14 @@ class FormattedTextArea(FormattedTextField):
     ):
         super().__init__(image, layer, text_contents, text_colour, flavour_text, is_centred)
         self.reference_layer = reference_layer
-    def execute(self):
+
+    def _render(self):
         # Rules text needs fixed-box mode for word wrapping.
         # Use the REFERENCE LAYER's width for the text box, not the original
         # rasterized placeholder which is often much narrower (e.g. 1297 vs 2584).
         # A small inset keeps text from touching the textbox edges.
-        ref_width = self.reference_layer.get_width()
+        ref_x, _, ref_right, _ = _reference_layer_bounds(self.reference_layer)
+        ref_width = int(ref_right - ref_x)
         text_box_width = int(ref_width * 0.95)  # 5% inset total (2.5% each side)
         self.layer = ensure_text_layer(
             self.image, self.layer, self.text_contents,
@@ -376,46 +548,27 @@ class FormattedTextArea(FormattedTextField):
             font_size=FONT_SIZE_RULES_TEXT,
         )
         # Position text layer horizontally centered within reference area
-        ref_offsets = self.reference_layer.get_offsets()
-        ref_x = ref_offsets[1] if len(ref_offsets) >= 3 else ref_offsets[0]
         inset = (ref_width - text_box_width) // 2
         layer_offsets = self.layer.get_offsets()
         layer_y = layer_offsets[2] if len(layer_offsets) >= 3 else layer_offsets[1]
         self.layer.set_offsets(int(ref_x + inset), int(layer_y))
         self.layer.set_visible(True)
-        self.layer.set_text(self.text_contents)
+        # No set_text() here: the layer is created with the text already, and
+        # format_text() replaces it with markup anyway, so it would only cost
+        # an extra relayout.
         # NOTE: format_text() sets layer base color to white before set_markup().
         # This ensures GIMP's outer <span color="..."> wrapper doesn't suppress
         # per-character foreground= color attributes (mana symbol colors).
         # Apply formatting (mana symbols, italics, flavour text)
-        italic_text = generate_italics(self.text_contents)
-        flavour_index = -1
-        if len(self.flavour_text) > 1:
-            flavour_text_split = self.flavour_text.split("*")
-            if len(flavour_text_split) > 1:
-                for i in range(0, len(flavour_text_split), 2):
-                    if flavour_text_split[i] != "":
-                        italic_text.append(flavour_text_split[i])
-                self.flavour_text = "".join(flavour_text_split)
-            else:
-                italic_text.append(self.flavour_text)
-            flavour_index = len(self.text_contents)
-        format_text(
-            self.layer,
-            self.text_contents + "\n" + self.flavour_text,
-            italic_text,
-            flavour_index,
-            self.is_centred,
-        )
-        if self.is_centred:
-            self.layer.set_justification(Gimp.TextJustification.CENTER)
+        self._format_text()
         # Scale to fit reference and align
-        if self.text_contents != "" or self.flavour_text != "":
-            scale_text_to_fit_reference(self.image, self.layer, self.reference_layer)
-            vertically_align_text(self.image, self.layer, self.reference_layer)
+        scale_text_to_fit_reference(self.image, self.layer, self.reference_layer)
+        vertically_align_text(self.image, self.layer, self.reference_layer)
 
 
 class CreatureFormattedTextArea(FormattedTextArea):
+    __slots__ = ("pt_reference_layer", "pt_top_reference_layer")
+
     def __init__(
         self,
         image,
@@ -440,8 +593,8 @@ class CreatureFormattedTextArea(FormattedTextArea):
         self.pt_reference_layer = pt_reference_layer
         self.pt_top_reference_layer = pt_top_reference_layer
 
-    def execute(self):
-        super().execute()
+    def _render(self):
+        super()._render()
         vertically_nudge_creature_text(
             self.image,
             self.layer,
@@ -0,0 +1,37 @@
+"""pytest configuration for the unit tests in this directory.
+
+The test_normal_card.py, test_batch.py and test_all_types.py scripts render
+real cards and are run through GIMP's batch interpreter (see AGENTS.md), so
+pytest does not collect them. The unit tests only call pure-Python helpers;
+when GIMP's introspection bindings are not available, a placeholder gi module
+is installed so the modules defining those helpers can still be imported.
+"""
+
+import os
+import sys
+import types
+from unittest import mock
+
+collect_ignore = ["test_normal_card.py", "test_batch.py", "test_all_types.py"]
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+
+def _gimp_available():
+    try:
+        import gi
+        gi.require_version('Gimp', '3.0')
+        from gi.repository import Gimp  # noqa: F401
+    except (ImportError, ValueError):
+        return False
+    return True
+
+
+if not _gimp_available():
+    _gi = types.ModuleType("gi")
+    _gi.require_version = lambda *args, **kwargs: None
+    _gi.repository = mock.MagicMock(name="gi.repository")
+    sys.modules["gi"] = _gi
+    sys.modules["gi.repository"] = _gi.repository
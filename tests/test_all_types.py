@@ -47,17 +47,25 @@ TEMPLATE_TEST_CARDS = {
 }
 
 
-def find_art_file(card_name):
+def build_art_index():
+    """Map lower-cased art filenames to their paths, in directory order."""
     if not os.path.isdir(FIXTURE_ART_DIR):
-        return None
+        return {}
+    index = {}
     for f in os.listdir(FIXTURE_ART_DIR):
-        if f.lower().startswith(card_name.lower()):
-            return os.path.join(FIXTURE_ART_DIR, f)
-    return None
+        index.setdefault(f.lower(), os.path.join(FIXTURE_ART_DIR, f))
+    return index
 
 
-def test_template_type(card_class, card_name):
-    art_path = find_art_file(card_name)
+def find_art_file(card_name, art_index=None):
+    if art_index is None:
+        art_index = build_art_index()
+    prefix = card_name.lower()
+    return next((path for name, path in art_index.items() if name.startswith(prefix)), None)
+
+
+def test_template_type(card_class, card_name, art_index=None):
+    art_path = find_art_file(card_name, art_index)
     if art_path is None:
         print(f"SKIP: {card_class} — no art file for '{card_name}' in {FIXTURE_ART_DIR}")
         return "skip"
@@ -83,8 +91,10 @@ def run_all():
     failed = 0
     skipped = 0
 
+    # List the art directory once for every card lookup below.
+    art_index = build_art_index()
     for card_class, card_name in TEMPLATE_TEST_CARDS.items():
-        result = test_template_type(card_class, card_name)
+        result = test_template_type(card_class, card_name, art_index)
         if result == "pass":
             passed += 1
         elif result == "fail":
@@ -99,7 +109,7 @@ def run_all():
         print("Expected filenames: 'CardName (Artist).jpg'")
         print("\nRequired cards:")
         for card_class, card_name in TEMPLATE_TEST_CARDS.items():
-            if find_art_file(card_name) is None:
+            if find_art_file(card_name, art_index) is None:
                 print(f"  - {card_name}")
     print("=" * 60)
     return failed == 0
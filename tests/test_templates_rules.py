@@ -0,0 +1,46 @@
+"""Unit tests for the rules text parsing in src/templates.py."""
+
+import pytest
+
+from src.constants import LayerNames
+from src.templates import _LOYALTY_RE, _classify_rules_text
+
+
+@pytest.mark.parametrize("ability, cost, text", [
+    ("+1: Draw a card.", "+1", "Draw a card."),
+    ("−X: Destroy target creature with mana value X.", "−X",
+     "Destroy target creature with mana value X."),
+    ("0: Untap target land.", "0", "Untap target land."),
+    ("−10: You get an emblem.", "−10", "You get an emblem."),
+    ("+2: Choose one: you gain 3 life or draw a card.", "+2",
+     "Choose one: you gain 3 life or draw a card."),
+    ("−3: Exile it.\nReturn it at the next end step.", "−3",
+     "Exile it.\nReturn it at the next end step."),
+])
+def test_loyalty_ability_splits_cost_from_text(ability, cost, text):
+    match = _LOYALTY_RE.match(ability)
+    assert match is not None
+    assert match.groups() == (cost, text)
+
+
+@pytest.mark.parametrize("ability", [
+    "Creatures you control get +1/+0.",
+    "As long as it's your turn: nothing happens.",
+    ": Not a cost.",
+    "+1 Draw a card.",
+    "",
+])
+def test_static_ability_is_not_a_loyalty_ability(ability):
+    assert _LOYALTY_RE.match(ability) is None
+
+
+@pytest.mark.parametrize("oracle_text, flavour_text, expected", [
+    ("", "", LayerNames.FULL_ART),
+    ("Flying", "", LayerNames.ONE_LINE_RULES_TEXT),
+    ("", "A lone spirit.", LayerNames.ONE_LINE_RULES_TEXT),
+    ("Flying", "A lone spirit.", LayerNames.RULES_TEXT),
+    ("Flying\nVigilance", "", LayerNames.RULES_TEXT),
+    ("", "Line one.\nLine two.", LayerNames.RULES_TEXT),
+])
+def test_classify_rules_text(oracle_text, flavour_text, expected):
+    assert _classify_rules_text(oracle_text, flavour_text) == expected
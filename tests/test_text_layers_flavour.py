@@ -0,0 +1,36 @@
+"""Unit tests for the flavour text parsing in src/text_layers.py."""
+
+import pytest
+
+from src.text_layers import _parse_flavour
+
+
+@pytest.mark.parametrize("flavour_text", ["", "*"])
+def test_no_flavour_has_no_index(flavour_text):
+    assert _parse_flavour(flavour_text, 12) == (flavour_text, (), -1)
+
+
+def test_plain_flavour_is_italic_and_starts_after_the_rules_text():
+    assert _parse_flavour("Every world is an organism.", 42) == (
+        "Every world is an organism.", ("Every world is an organism.",), 42,
+    )
+
+
+def test_flavour_index_at_the_text_boundaries():
+    # No rules text: the flavour starts at the very beginning.
+    assert _parse_flavour("Quiet.", 0)[2] == 0
+    # Two-character flavour is the shortest that counts as flavour.
+    assert _parse_flavour("Hm", 7) == ("Hm", ("Hm",), 7)
+
+
+def test_asterisk_runs_stay_upright_and_are_removed():
+    flavour, italics, index = _parse_flavour("*Whispers* said the *wind*.", 10)
+    assert flavour == "Whispers said the wind."
+    assert italics == (" said the ", ".")
+    assert index == 10
+
+
+def test_text_around_an_asterisk_run_is_italic():
+    flavour, italics, _ = _parse_flavour("Plain *emphasis* end", 3)
+    assert flavour == "Plain emphasis end"
+    assert italics == ("Plain ", " end")
@@ -0,0 +1,66 @@
+"""Unit tests for the layer checks in verify_templates.py."""
+
+import pytest
+
+import verify_templates as vt
+from src.constants import LayerNames
+
+
+@pytest.fixture
+def complete_layers():
+    vt._load_constants()
+    names = set(vt.COMMON_REQUIRED_LAYERS) | set(vt.TEXT_LAYERS_MUST_BE_EDITABLE)
+    return {
+        "names": sorted(names),
+        "text_names": sorted(vt.TEXT_LAYERS_MUST_BE_EDITABLE),
+    }
+
+
+def test_complete_template_passes(complete_layers):
+    result = vt.check_template_layers("/x/normal.xcf", complete_layers)
+    assert result["ok"]
+    assert result["file"] == "normal.xcf"
+    assert result["missing_layers"] == []
+    assert result["rasterized_text_layers"] == []
+    assert result["total_layers"] == len(complete_layers["names"])
+    assert result["total_text_layers"] == len(complete_layers["text_names"])
+
+
+def test_missing_required_layers_fail_in_required_order(complete_layers):
+    missing = [LayerNames.MANA_COST, LayerNames.NAME]
+    complete_layers["names"] = [n for n in complete_layers["names"] if n not in missing]
+    complete_layers["text_names"] = [n for n in complete_layers["text_names"] if n not in missing]
+    result = vt.check_template_layers("normal.xcf", complete_layers)
+    assert not result["ok"]
+    assert result["missing_layers"] == [n for n in vt.COMMON_REQUIRED_LAYERS if n in missing]
+
+
+def test_rasterized_text_layer_warns_without_failing(complete_layers):
+    complete_layers["text_names"] = [
+        n for n in complete_layers["text_names"] if n != LayerNames.TYPE_LINE
+    ]
+    result = vt.check_template_layers("normal.xcf", complete_layers)
+    assert result["ok"]
+    assert result["rasterized_text_layers"] == [LayerNames.TYPE_LINE]
+
+
+def test_custom_required_layers(complete_layers):
+    result = vt.check_template_layers(
+        "normal.xcf", complete_layers, required_layers=["Not In Template"],
+    )
+    assert not result["ok"]
+    assert result["missing_layers"] == ["Not In Template"]
+
+
+def test_load_error_is_fatal():
+    result = vt.check_template_layers("broken.xcf", {"error": "Could not load file"})
+    assert not result["ok"]
+    assert result["missing_layers"] == ["FATAL: Could not load file"]
+    assert result["total_layers"] == 0
+
+
+def test_partial_read_is_flagged(complete_layers):
+    complete_layers["partial"] = True
+    result = vt.check_template_layers("normal.xcf", complete_layers)
+    assert result["ok"]
+    assert result["partial"]
@@ -8,14 +8,41 @@ Usage:
 
 Cross-references layer names from src/constants.py against
 actual layers in each XCF file.
+
+Set MTG_VERIFY_WORKERS=N to spread the files over N headless GIMP processes,
+and MTG_VERIFY_QUICK=1 (or --quick) to stop walking each template once its
+required layers turn up. MTG_VERIFY_REPORT=PATH (or --report PATH) also
+writes the results as JSON to PATH.
+Layer names are cached per file (see VERIFY_CACHE_PATH), so unchanged
+templates are not reloaded on the next run. GIMP is only imported when a
+file actually has to be loaded, so the script also runs from plain Python
+with workers or a warm cache:
+
+    MTG_VERIFY_WORKERS=4 python3 verify_templates.py
 """
 
+import hashlib
+import json
 import os
+import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Gimp and Gio from gi.repository, imported by _gimp() on first use so runs
+# that never load a file (cache hits, worker parents, a missing directory)
+# don't pay for GObject introspection.
+_GIMP_MODULES = None
 
-import gi
-gi.require_version('Gimp', '3.0')
-from gi.repository import Gimp, Gio
+
+def _gimp():
+    global _GIMP_MODULES
+    if _GIMP_MODULES is None:
+        import gi
+        gi.require_version('Gimp', '3.0')
+        from gi.repository import Gimp, Gio
+        _GIMP_MODULES = (Gimp, Gio)
+    return _GIMP_MODULES
 
 # ── Configuration ──────────────────────────────────────────────────────────────
 
@@ -31,111 +58,236 @@ XCF_DIR = os.path.join(SCRIPT_DIR, "templates")
 if SCRIPT_DIR not in sys.path:
     sys.path.insert(0, SCRIPT_DIR)
 
-from src.constants import LayerNames
-
-# Map convenient short names to LayerNames class attributes
-CARD_NAME = LayerNames.NAME
-MANA_COST = LayerNames.MANA_COST
-TYPE_LINE = LayerNames.TYPE_LINE
-RULES_TEXT = LayerNames.RULES_TEXT
-RULES_TEXT_NONCREATURE = LayerNames.RULES_TEXT_NONCREATURE
-POWER_TOUGHNESS = LayerNames.POWER_TOUGHNESS
-EXPANSION_SYMBOL = LayerNames.EXPANSION_SYMBOL
-ART_LAYER = LayerNames.ART_FRAME
-ARTIST = LayerNames.ARTIST
-
-# Layers that MUST exist in every standard template
-COMMON_REQUIRED_LAYERS = [
-    CARD_NAME,
-    MANA_COST,
-    TYPE_LINE,
-    ART_LAYER,
-]
-
-# Layers that SHOULD exist in creature templates
-CREATURE_LAYERS = [
-    POWER_TOUGHNESS,
-    RULES_TEXT,
-]
-
-# Layers that SHOULD exist in noncreature templates
-NONCREATURE_LAYERS = [
-    RULES_TEXT_NONCREATURE,
-]
-
-# Text layers that must be editable (not rasterized)
-TEXT_LAYERS_MUST_BE_EDITABLE = [
-    CARD_NAME,
-    MANA_COST,
-    TYPE_LINE,
-    RULES_TEXT,
-    RULES_TEXT_NONCREATURE,
-    POWER_TOUGHNESS,
-]
+# Layer name constants, bound by _load_constants() the first time a template
+# is read or checked so that runs which exit early (missing directory, no
+# templates) don't import src.constants.
+CARD_NAME = MANA_COST = TYPE_LINE = None
+RULES_TEXT = RULES_TEXT_NONCREATURE = POWER_TOUGHNESS = None
+EXPANSION_SYMBOL = ART_LAYER = ARTIST = None
+COMMON_REQUIRED_LAYERS = CREATURE_LAYERS = NONCREATURE_LAYERS = ()
+TEXT_LAYERS_MUST_BE_EDITABLE = ()
+COMMON_REQUIRED_LAYER_SET = TEXT_LAYERS_MUST_BE_EDITABLE_SET = frozenset()
+_CONSTANTS_LOADED = False
+
+
+def _load_constants():
+    global _CONSTANTS_LOADED
+    global CARD_NAME, MANA_COST, TYPE_LINE, RULES_TEXT, RULES_TEXT_NONCREATURE
+    global POWER_TOUGHNESS, EXPANSION_SYMBOL, ART_LAYER, ARTIST
+    global COMMON_REQUIRED_LAYERS, CREATURE_LAYERS, NONCREATURE_LAYERS
+    global TEXT_LAYERS_MUST_BE_EDITABLE, COMMON_REQUIRED_LAYER_SET
+    global TEXT_LAYERS_MUST_BE_EDITABLE_SET
+    if _CONSTANTS_LOADED:
+        return
+
+    from src.constants import LayerNames
+
+    # Map convenient short names to LayerNames class attributes. They are
+    # interned like the layer names the walkers collect, so set lookups
+    # between the two usually compare the same string object.
+    CARD_NAME = sys.intern(LayerNames.NAME)
+    MANA_COST = sys.intern(LayerNames.MANA_COST)
+    TYPE_LINE = sys.intern(LayerNames.TYPE_LINE)
+    RULES_TEXT = sys.intern(LayerNames.RULES_TEXT)
+    RULES_TEXT_NONCREATURE = sys.intern(LayerNames.RULES_TEXT_NONCREATURE)
+    POWER_TOUGHNESS = sys.intern(LayerNames.POWER_TOUGHNESS)
+    EXPANSION_SYMBOL = sys.intern(LayerNames.EXPANSION_SYMBOL)
+    ART_LAYER = sys.intern(LayerNames.ART_FRAME)
+    ARTIST = sys.intern(LayerNames.ARTIST)
+
+    # The tuples below give the order problems are reported in; the matching
+    # frozensets are for membership tests.
+
+    # Layers that MUST exist in every standard template
+    COMMON_REQUIRED_LAYERS = (
+        CARD_NAME,
+        MANA_COST,
+        TYPE_LINE,
+        ART_LAYER,
+    )
+
+    # Layers that SHOULD exist in creature templates
+    CREATURE_LAYERS = (
+        POWER_TOUGHNESS,
+        RULES_TEXT,
+    )
+
+    # Layers that SHOULD exist in noncreature templates
+    NONCREATURE_LAYERS = (
+        RULES_TEXT_NONCREATURE,
+    )
+
+    # Text layers that must be editable (not rasterized)
+    TEXT_LAYERS_MUST_BE_EDITABLE = (
+        CARD_NAME,
+        MANA_COST,
+        TYPE_LINE,
+        RULES_TEXT,
+        RULES_TEXT_NONCREATURE,
+        POWER_TOUGHNESS,
+    )
+    TEXT_LAYERS_MUST_BE_EDITABLE_SET = frozenset(TEXT_LAYERS_MUST_BE_EDITABLE)
+    COMMON_REQUIRED_LAYER_SET = frozenset(COMMON_REQUIRED_LAYERS)
+    _CONSTANTS_LOADED = True
 
 
 # ── Verification Logic ────────────────────────────────────────────────────────
 
 
-def collect_layer_names(image_or_group):
-    """Recursively collect all layer names from an image or group."""
-    names = set()
-    text_layer_names = set()
+def _no_children(_):
+    return []
 
-    if hasattr(image_or_group, 'get_layers'):
-        layers = image_or_group.get_layers()
-    elif hasattr(image_or_group, 'get_children'):
-        layers = image_or_group.get_children()
-    else:
-        return names, text_layer_names
 
-    for layer in layers:
-        name = layer.get_name()
+# type -> (child getter, is text layer, is group), worked out once per class
+# from GIMP's concrete classes so the walker classifies each layer with a
+# single dict lookup instead of calling is_text_layer() and is_group().
+_LAYER_PROBES = {}
+
+
+def _layer_probes(layer_type):
+    probes = _LAYER_PROBES.get(layer_type)
+    if probes is None:
+        Gimp, _ = _gimp()
+        group = issubclass(layer_type, Gimp.GroupLayer)
+        if issubclass(layer_type, Gimp.Image):
+            children = Gimp.Image.get_layers
+        elif group:
+            children = Gimp.GroupLayer.get_children
+        else:
+            children = _no_children
+        probes = (children, issubclass(layer_type, Gimp.TextLayer), group)
+        _LAYER_PROBES[layer_type] = probes
+    return probes
+
+
+def _child_layers(image_or_group):
+    return _layer_probes(type(image_or_group))[0](image_or_group)
+
+
+def walk_layer_names(image_or_group, required=frozenset(), required_text=frozenset(),
+                     stop_early=False, tree_lines=None):
+    """Collect layer names and text layer names from an image or group.
+
+    With stop_early, the walk ends as soon as every name in required has been
+    seen and every required_text name seen so far has a text layer, even if
+    groups remain unvisited. If tree_lines is a list, a line describing each
+    visited layer is appended to it, in stacking order and indented by depth.
+
+    Returns:
+        (names, text_layer_names, complete) where complete is False if the
+        walk stopped early
+    """
+    names = set()
+    text_layer_names = set()
+    missing = set(required)
+    # required_text names seen only on non-text layers so far
+    pending_text = set()
+
+    # Walk with an explicit stack rather than recursing into each group.
+    # Children are pushed in reverse so they pop off in stacking order.
+    stack = [(layer, 0) for layer in reversed(_child_layers(image_or_group))]
+    while stack:
+        layer, depth = stack.pop()
+        get_children, text, group = _layer_probes(type(layer))
+        # Templates repeat the same few dozen names; intern them so every
+        # template shares one string per name.
+        name = sys.intern(layer.get_name())
         names.add(name)
+        missing.discard(name)
 
-        if hasattr(layer, 'is_text_layer') and layer.is_text_layer():
+        if text:
             text_layer_names.add(name)
+            pending_text.discard(name)
+        elif name in required_text and name not in text_layer_names:
+            pending_text.add(name)
+
+        if tree_lines is not None:
+            layer_type = "GROUP" if group else ("TEXT" if text else "LAYER")
+            visible = "V" if layer.get_visible() else "H"
+            tree_lines.append(f"{'  ' * depth}[{layer_type}][{visible}] {name}")
+
+        if group:
+            stack.extend((child, depth + 1) for child in reversed(get_children(layer)))
 
-        if hasattr(layer, 'is_group') and layer.is_group():
-            child_names, child_text = collect_layer_names(layer)
-            names.update(child_names)
-            text_layer_names.update(child_text)
+        if stop_early and stack and not missing and not pending_text:
+            return names, text_layer_names, False
 
+    return names, text_layer_names, True
+
+
+def collect_layer_names(image_or_group):
+    """Collect all layer names from an image or group, including nested groups."""
+    names, text_layer_names, _ = walk_layer_names(image_or_group)
     return names, text_layer_names
 
 
-def dump_layer_tree(image_or_group, indent=0):
-    """Recursively print layer tree for debugging."""
-    if hasattr(image_or_group, 'get_layers'):
-        layers = image_or_group.get_layers()
-    elif hasattr(image_or_group, 'get_children'):
-        layers = image_or_group.get_children()
-    else:
-        return
+def read_template_layers(xcf_path, verbose=False, quick=False):
+    """Load an XCF file and collect what the layer checks need.
 
-    for layer in layers:
-        layer_type = "GROUP" if (hasattr(layer, 'is_group') and layer.is_group()) else (
-            "TEXT" if (hasattr(layer, 'is_text_layer') and layer.is_text_layer()) else "LAYER"
-        )
-        visible = "V" if layer.get_visible() else "H"
-        prefix = "  " * indent
-        print(f"{prefix}[{layer_type}][{visible}] {layer.get_name()}")
+    Prints nothing, so it can run inside a worker process.
 
-        if hasattr(layer, 'is_group') and layer.is_group():
-            dump_layer_tree(layer, indent + 1)
+    Args:
+        xcf_path: Path to XCF file
+        verbose: Also include the full layer tree as "layer_tree" (a list of lines)
+        quick: Stop walking once the required layers are found and the
+            editable text layers seen so far are text (ignored when verbose).
+            Layer counts are then partial and the result has "partial": True.
 
+    Returns:
+        dict with sorted "names" and "text_names" lists, or an "error" message
+        when the file could not be loaded or walked
+    """
+    _load_constants()
+    Gimp, Gio = _gimp()
+    # A file that makes GIMP raise is reported as a failure like any other,
+    # in this process and in workers alike, instead of ending the run.
+    try:
+        gfile = Gio.File.new_for_path(xcf_path)
+        image = Gimp.file_load(Gimp.RunMode.NONINTERACTIVE, gfile)
+    except Exception as error:
+        return {"error": f"Verification raised: {error}"}
 
-def verify_template(xcf_path, required_layers=None, verbose=False):
-    """Verify a single XCF template has required layers.
+    if image is None:
+        return {"error": "Could not load file"}
+
+    # Delete the image even if walking it fails, so a bad template can't
+    # leave its image behind for the rest of the run.
+    try:
+        layers = {}
+        # One walk serves both the checks and the verbose tree dump.
+        tree_lines = [] if verbose else None
+        all_names, text_names, complete = walk_layer_names(
+            image,
+            required=COMMON_REQUIRED_LAYER_SET,
+            required_text=TEXT_LAYERS_MUST_BE_EDITABLE_SET,
+            stop_early=quick and not verbose,
+            tree_lines=tree_lines,
+        )
+        if verbose:
+            layers["layer_tree"] = tree_lines
+        layers["names"] = sorted(all_names)
+        layers["text_names"] = sorted(text_names)
+        if not complete:
+            layers["partial"] = True
+    except Exception as error:
+        return {"error": f"Verification raised: {error}"}
+    finally:
+        image.delete()
+    return layers
+
+
+def check_template_layers(xcf_path, layers, required_layers=None):
+    """Check the layer names read by read_template_layers().
 
     Args:
         xcf_path: Path to XCF file
+        layers: dict returned by read_template_layers()
         required_layers: List of required layer names (defaults to COMMON_REQUIRED_LAYERS)
-        verbose: Print full layer tree
 
     Returns:
         dict with verification results
     """
+    _load_constants()
     if required_layers is None:
         required_layers = COMMON_REQUIRED_LAYERS
 
@@ -149,42 +301,264 @@ def verify_template(xcf_path, required_layers=None, verbose=False):
         "ok": True,
     }
 
-    gfile = Gio.File.new_for_path(xcf_path)
-    image = Gimp.file_load(Gimp.RunMode.NONINTERACTIVE, gfile)
-
-    if image is None:
+    if "error" in layers:
         result["ok"] = False
-        result["missing_layers"] = ["FATAL: Could not load file"]
+        result["missing_layers"] = [f"FATAL: {layers['error']}"]
         return result
 
-    if verbose:
-        print(f"\n--- Layer Tree: {result['file']} ---")
-        dump_layer_tree(image)
+    if "layer_tree" in layers:
+        result["layer_tree"] = layers["layer_tree"]
 
-    all_names, text_names = collect_layer_names(image)
-    result["total_layers"] = len(all_names)
-    result["total_text_layers"] = len(text_names)
+    # "names" and "text_names" are already unique, so they are counted as
+    # they are. Only the names the checks ask about are collected into sets,
+    # which keeps these independent of how many layers the template has.
+    result["total_layers"] = len(layers["names"])
+    result["total_text_layers"] = len(layers["text_names"])
+    if layers.get("partial"):
+        result["partial"] = True
 
-    for name in required_layers:
-        if name not in all_names:
-            result["missing_layers"].append(name)
+    found = TEXT_LAYERS_MUST_BE_EDITABLE_SET.union(required_layers).intersection(layers["names"])
+    found_text = TEXT_LAYERS_MUST_BE_EDITABLE_SET.intersection(layers["text_names"])
 
-    for name in TEXT_LAYERS_MUST_BE_EDITABLE:
-        if name in all_names and name not in text_names:
-            result["rasterized_text_layers"].append(name)
+    # Editable-text names that only ever appear on non-text layers; a text
+    # layer with the same name elsewhere in the tree counts as editable.
+    raster_only = TEXT_LAYERS_MUST_BE_EDITABLE_SET.intersection(found).difference(found_text)
+    result["missing_layers"] = [name for name in required_layers if name not in found]
+    result["rasterized_text_layers"] = [
+        name for name in TEXT_LAYERS_MUST_BE_EDITABLE if name in raster_only
+    ]
 
     result["ok"] = len(result["missing_layers"]) == 0
-
-    image.delete()
     return result
 
 
-def verify_all(xcf_dir=None, verbose=False):
+def verify_template(xcf_path, required_layers=None, verbose=False):
+    """Verify a single XCF template has required layers.
+
+    Args:
+        xcf_path: Path to XCF file
+        required_layers: List of required layer names (defaults to COMMON_REQUIRED_LAYERS)
+        verbose: Include the full layer tree as "layer_tree" (a list of lines)
+
+    Returns:
+        dict with verification results
+    """
+    return check_template_layers(
+        xcf_path, read_template_layers(xcf_path, verbose=verbose), required_layers,
+    )
+
+
+def _warm_file(path, chunk_size=1 << 20):
+    """Read a file and discard the data so the OS has it cached."""
+    try:
+        with open(path, "rb") as f:
+            while f.read(chunk_size):
+                pass
+    except OSError:
+        pass
+
+
+def iter_templates_serially(xcf_paths, verbose=False, quick=False, read_ahead=2):
+    """Read templates one at a time in this GIMP process, yielding each
+    read_template_layers() dict as soon as that file is done.
+
+    While GIMP loads one file, a background thread reads the next
+    read_ahead files from disk, so their loads start from the page cache
+    instead of waiting on storage.
+    """
+    with ThreadPoolExecutor(max_workers=read_ahead) as executor:
+        warming = {}
+        for index, xcf_path in enumerate(xcf_paths):
+            for ahead in xcf_paths[index + 1:index + 1 + read_ahead]:
+                if ahead not in warming:
+                    warming[ahead] = executor.submit(_warm_file, ahead)
+            warming.pop(xcf_path, None)
+            yield read_template_layers(xcf_path, verbose=verbose, quick=quick)
+
+
+# ── Layer Name Cache ──────────────────────────────────────────────────────────
+
+# Layer names per XCF file, reused while the file's mtime and size are
+# unchanged so repeat runs skip Gimp.file_load. Once a file has been seen with
+# the same size but a new mtime (a fresh checkout, a copy), its entry also
+# keeps a digest, so the next touch without a content change still hits.
+# MTG_VERIFY_CACHE overrides the location; set it to an empty string to
+# disable the cache.
+VERIFY_CACHE_PATH = os.environ.get(
+    "MTG_VERIFY_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "mtg-gimp-automation", "verify_cache.json"),
+)
+
+
+def _load_cache(cache_path):
+    if not cache_path:
+        return {}
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_cache(cache_path, cache):
+    if not cache_path:
+        return
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = cache_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as error:
+        print(f"WARNING: Could not write verify cache {cache_path}: {error}")
+
+
+def _file_digest(path, chunk_size=1 << 20):
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _cached_layers(cache, xcf_path, stat, verbose):
+    """Return (layers, digest) for xcf_path from the cache.
+
+    layers is None on a miss. The file is only hashed when its size matches
+    the entry but its mtime does not; digest is then the file's digest (to be
+    kept with a fresh read on a miss), and on a hit it means the entry's mtime
+    was updated and the cache should be saved. Otherwise digest is None.
+    """
+    entry = cache.get(os.path.abspath(xcf_path))
+    if not entry or entry.get("size") != stat.st_size:
+        return None, None
+    if verbose and "layer_tree" not in entry["layers"]:
+        return None, None
+    if entry.get("mtime_ns") == stat.st_mtime_ns:
+        return entry["layers"], None
+    try:
+        digest = _file_digest(xcf_path)
+    except OSError:
+        return None, None
+    if entry.get("digest") != digest:
+        return None, digest
+    entry["mtime_ns"] = stat.st_mtime_ns
+    return entry["layers"], digest
+
+
+# ── Report ────────────────────────────────────────────────────────────────────
+
+# Optional JSON copy of the results so CI jobs can diff two runs. Each entry
+# records the mtime_ns and size of the file it was checked from, which tells
+# whether the entry is stale. Only written when MTG_VERIFY_REPORT (or
+# --report) names a file.
+VERIFY_REPORT_PATH = os.environ.get("MTG_VERIFY_REPORT") or None
+
+
+def _save_report(report_path, results):
+    try:
+        report_dir = os.path.dirname(report_path)
+        if report_dir:
+            os.makedirs(report_dir, exist_ok=True)
+        tmp_path = report_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"generated_at": time.time(), "results": results}, f,
+                      indent=2, sort_keys=True)
+            f.write("\n")
+        os.replace(tmp_path, report_path)
+    except OSError as error:
+        print(f"WARNING: Could not write verify report {report_path}: {error}")
+
+
+# ── Worker Processes ──────────────────────────────────────────────────────────
+
+# Prefix for the one-line JSON results a worker prints; GIMP writes its own
+# messages to stdout too, so the parent only reads lines starting with this.
+RESULT_MARKER = "VERIFY_RESULT "
+
+
+def _worker_command(gimp_command):
+    """Build the headless GIMP command line that runs this script as a worker."""
+    script_path = os.path.join(SCRIPT_DIR, 'verify_templates.py')
+    script = (
+        "import sys\n"
+        f"sys.path.insert(0, {SCRIPT_DIR!r})\n"
+        f"exec(open({script_path!r}).read())\n"
+    )
+    return [gimp_command, "-i", "--batch-interpreter", "python-fu-eval", "-b", script, "--quit"]
+
+
+def _run_worker(gimp_command, xcf_paths, verbose, quick):
+    """Read a shard of files in one headless GIMP process."""
+    env = dict(os.environ)
+    env["MTG_VERIFY_FILES"] = os.pathsep.join(xcf_paths)
+    env["MTG_VERIFY_VERBOSE"] = "1" if verbose else ""
+    env["MTG_VERIFY_QUICK"] = "1" if quick else ""
+    env.pop("MTG_VERIFY_WORKERS", None)
+    try:
+        completed = subprocess.run(
+            _worker_command(gimp_command),
+            cwd=SCRIPT_DIR, env=env, stdout=subprocess.PIPE, text=True,
+        )
+    except OSError as error:
+        # GIMP missing or not runnable: fail this shard's files, not the run.
+        return [{"error": f"Could not start GIMP worker: {error}"} for _ in xcf_paths]
+    layers_by_path = {}
+    for line in completed.stdout.splitlines():
+        if line.startswith(RESULT_MARKER):
+            message = json.loads(line[len(RESULT_MARKER):])
+            layers_by_path[message["path"]] = message["layers"]
+    return [
+        layers_by_path.get(path) or {"error": "verification worker failed"}
+        for path in xcf_paths
+    ]
+
+
+def read_in_workers(xcf_paths, workers, verbose=False, quick=False):
+    """Read template layers across several headless GIMP processes.
+
+    GIMP's Python interpreter can only drive its own process, so each worker
+    is a separate GIMP running this script on a round-robin shard of the
+    files and printing one JSON line per file. Returns the
+    read_template_layers() dicts in the order of xcf_paths.
+    """
+    from src.config import GIMP_COMMAND
+
+    workers = max(1, min(workers, len(xcf_paths)))
+    shards = [xcf_paths[i::workers] for i in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        shard_layers = list(executor.map(
+            lambda shard: _run_worker(GIMP_COMMAND, shard, verbose, quick), shards,
+        ))
+    by_path = {}
+    for shard, layers in zip(shards, shard_layers):
+        by_path.update(zip(shard, layers))
+    return [by_path[path] for path in xcf_paths]
+
+
+def _print_worker_results(xcf_paths, verbose=False, quick=False):
+    """Worker side of read_in_workers(): one JSON line per file."""
+    for xcf_path in xcf_paths:
+        layers = read_template_layers(xcf_path, verbose=verbose, quick=quick)
+        print(RESULT_MARKER + json.dumps({"path": xcf_path, "layers": layers}), flush=True)
+
+
+def verify_all(xcf_dir=None, verbose=False, workers=None, cache_path=VERIFY_CACHE_PATH,
+               quick=False, report_path=VERIFY_REPORT_PATH):
     """Verify all XCF templates in directory.
 
     Args:
         xcf_dir: Directory containing XCF files (defaults to XCF_DIR)
         verbose: Print full layer trees
+        workers: Number of headless GIMP processes to verify with; None or 1
+            verifies every file in this process
+        cache_path: Layer name cache file (defaults to VERIFY_CACHE_PATH);
+            None or "" loads every file
+        quick: Stop walking each template once its required layers are found
+            (see read_template_layers); layer counts are then shown with "+"
+        report_path: File to write the results to as JSON (defaults to
+            VERIFY_REPORT_PATH); None or "" writes no report
     """
     xcf_dir = xcf_dir or XCF_DIR
 
@@ -193,78 +567,172 @@ def verify_all(xcf_dir=None, verbose=False):
         print("Run convert_templates.py first to create XCF files.")
         return
 
-    xcf_files = sorted([f for f in os.listdir(xcf_dir) if f.lower().endswith('.xcf')])
+    # scandir entries carry the file type from the directory listing and
+    # remember their stat() result, which the cache check below reuses.
+    with os.scandir(xcf_dir) as it:
+        xcf_entries = sorted(
+            (entry for entry in it if entry.name.lower().endswith('.xcf') and entry.is_file()),
+            key=lambda entry: entry.name,
+        )
 
-    if not xcf_files:
+    if not xcf_entries:
         print(f"No .xcf files found in {xcf_dir}")
         return
 
-    print(f"Verifying {len(xcf_files)} XCF templates")
+    print(f"Verifying {len(xcf_entries)} XCF templates")
     print("=" * 60)
 
-    results = []
-    for filename in xcf_files:
-        xcf_path = os.path.join(xcf_dir, filename)
-        result = verify_template(xcf_path, verbose=verbose)
-        results.append(result)
+    # Only files that changed since the cached read need GIMP to load them.
+    cache = _load_cache(cache_path)
+    cached_layers = {}
+    to_read = []
+    digests = {}
+    refreshed = False
+    for entry in xcf_entries:
+        cached, digest = _cached_layers(cache, entry.path, entry.stat(), verbose)
+        if cached is None:
+            to_read.append(entry.path)
+            if digest:
+                digests[entry.path] = digest
+        else:
+            cached_layers[entry.path] = cached
+            refreshed = refreshed or digest is not None
+
+    if workers and workers > 1 and to_read:
+        fresh_layers = iter(read_in_workers(to_read, workers, verbose=verbose, quick=quick))
+    else:
+        fresh_layers = iter_templates_serially(to_read, verbose=verbose, quick=quick)
 
-    # Summary
     print("\n" + "=" * 60)
     print("VERIFICATION SUMMARY")
     print("=" * 60)
 
+    # Each file is reported as soon as it has been checked; only the
+    # counters and, when a report is wanted, its entries are kept.
     passed = 0
     warned = 0
     failed = 0
+    report = []
+
+    try:
+        for entry in xcf_entries:
+            stat = entry.stat()
+            layers = cached_layers.get(entry.path)
+            if layers is None:
+                layers = next(fresh_layers)
+                # Partial quick-mode reads can't stand in for a full read later.
+                if "error" not in layers and not layers.get("partial"):
+                    cached = {
+                        "mtime_ns": stat.st_mtime_ns,
+                        "size": stat.st_size,
+                        "layers": layers,
+                    }
+                    if entry.path in digests:
+                        cached["digest"] = digests[entry.path]
+                    cache[os.path.abspath(entry.path)] = cached
+            r = check_template_layers(entry.path, layers)
+
+            # Assemble the file's report and write it in one go.
+            out = []
+            if "layer_tree" in r:
+                out.append(f"\n--- Layer Tree: {r['file']} ---\n")
+                out.extend(line + "\n" for line in r["layer_tree"])
+
+            if not r["ok"]:
+                status = "FAIL"
+                failed += 1
+            elif r["rasterized_text_layers"]:
+                status = "WARN"
+                warned += 1
+            else:
+                status = "OK"
+                passed += 1
+
+            more = "+" if r.get("partial") else ""
+            out.append(f"  [{status}] {r['file']} "
+                       f"({r['total_layers']}{more} layers, {r['total_text_layers']}{more} text)\n")
 
-    for r in results:
-        if not r["ok"]:
-            status = "FAIL"
-            failed += 1
-        elif r["rasterized_text_layers"]:
-            status = "WARN"
-            warned += 1
-        else:
-            status = "OK"
-            passed += 1
-
-        print(f"  [{status}] {r['file']} "
-              f"({r['total_layers']} layers, {r['total_text_layers']} text)")
-
-        if r["missing_layers"]:
             for name in r["missing_layers"]:
-                print(f"    MISSING: {name}")
+                out.append(f"    MISSING: {name}\n")
 
-        if r["rasterized_text_layers"]:
             for name in r["rasterized_text_layers"]:
-                print(f"    RASTERIZED (needs recreation): {name}")
+                out.append(f"    RASTERIZED (needs recreation): {name}\n")
 
-    print(f"\nTotal: {passed} OK, {warned} warnings, {failed} failed")
+            sys.stdout.write("".join(out))
+
+            if report_path:
+                r.pop("layer_tree", None)
+                r["status"] = status
+                r["mtime_ns"] = stat.st_mtime_ns
+                r["size"] = stat.st_size
+                report.append(r)
+    finally:
+        # Keep whatever was read, even if the run stopped part way.
+        if to_read or refreshed:
+            _save_cache(cache_path, cache)
+
+    if report_path:
+        _save_report(report_path, report)
+
+    out = [f"\nTotal: {passed} OK, {warned} warnings, {failed} failed\n"]
 
     if warned > 0 or failed > 0:
-        print("\nNext steps:")
+        out.append("\nNext steps:\n")
         if failed > 0:
-            print("  1. Re-run convert_templates.py for failed files")
+            out.append("  1. Re-run convert_templates.py for failed files\n")
         if warned > 0:
-            print("  2. Open warned templates in GIMP GUI")
-            print("     - Delete rasterized text layers")
-            print("     - Recreate as native Text layers with correct fonts:")
-            print(f"       Card Name: Beleren2016-Bold-Asterisk")
-            print(f"       Mana Cost: NDPMTG")
-            print(f"       Type Line: PlantinMTPro-Bold")
-            print(f"       Rules Text: PlantinMTPro-Regular")
-            print(f"       Power/Toughness: Beleren2016-Bold-Asterisk")
+            out.append("  2. Open warned templates in GIMP GUI\n"
+                       "     - Delete rasterized text layers\n"
+                       "     - Recreate as native Text layers with correct fonts:\n"
+                       "       Card Name: Beleren2016-Bold-Asterisk\n"
+                       "       Mana Cost: NDPMTG\n"
+                       "       Type Line: PlantinMTPro-Bold\n"
+                       "       Rules Text: PlantinMTPro-Regular\n"
+                       "       Power/Toughness: Beleren2016-Bold-Asterisk\n")
+
+    sys.stdout.write("".join(out))
 
 
 # ── Entry Point ───────────────────────────────────────────────────────────────
 
-if __name__ == "__main__":
+def _workers_from_env():
+    """MTG_VERIFY_WORKERS as a worker count, or None to verify serially."""
+    value = os.environ.get("MTG_VERIFY_WORKERS", "").strip()
+    if not value:
+        return None
+    try:
+        return int(value) or None
+    except ValueError:
+        print(f"WARNING: MTG_VERIFY_WORKERS={value!r} is not a number; "
+              "verifying in this process")
+        return None
+
+
+_quick = bool(os.environ.get("MTG_VERIFY_QUICK"))
+
+if os.environ.get("MTG_VERIFY_FILES"):
+    # Started by read_in_workers(): verify the given shard and report back.
+    _print_worker_results(
+        os.environ["MTG_VERIFY_FILES"].split(os.pathsep),
+        verbose=bool(os.environ.get("MTG_VERIFY_VERBOSE")),
+        quick=_quick,
+    )
+elif __name__ == "__main__":
     verbose = "--verbose" in sys.argv or "-v" in sys.argv
+    _quick = _quick or "--quick" in sys.argv
     xcf_dir = None
-    for arg in sys.argv[1:]:
-        if not arg.startswith("-"):
+    report_path = VERIFY_REPORT_PATH
+    args = iter(sys.argv[1:])
+    for arg in args:
+        if arg == "--report":
+            report_path = next(args, None)
+        elif arg.startswith("--report="):
+            report_path = arg.partition("=")[2]
+        elif not arg.startswith("-") and xcf_dir is None:
             xcf_dir = arg
-            break
-    verify_all(xcf_dir, verbose=verbose)
-else:
-    verify_all()
+    verify_all(xcf_dir, verbose=verbose, workers=_workers_from_env(), quick=_quick,
+               report_path=report_path)
+elif __name__ != "verify_templates":
+    # exec()'d into another module's namespace (e.g. from a GIMP batch
+    # script); a plain "import verify_templates" only defines the functions.
+    verify_all(workers=_workers_from_env(), quick=_quick)